@@ -4,7 +4,15 @@ from dataclasses import dataclass
 from datetime import datetime
 import json
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
 
 
 @dataclass(frozen=True)
@@ -12,21 +20,34 @@ class ModelInputs:
     premissas: Dict[str, float]
     datas: List[datetime]
     feriados: List[datetime]
-    curva_du: List[float]
-    curva_cdi: List[float]
+    curva_du: Tuple[float, ...]
+    curva_cdi: Tuple[float, ...]
 
 
 def load_model_inputs(path: str) -> ModelInputs:
-    data = json.loads(Path(path).read_text(encoding="utf-8"))
+    data = _read_json(Path(path))
     premissas = {k: float(v) for k, v in data.get("premissas", {}).items()}
-    datas = [datetime.fromisoformat(value) for value in data.get("datas", [])]
-    feriados = [datetime.fromisoformat(value) for value in data.get("feriados", [])]
-    curva_du = [float(v) for v in data.get("curva_du", [])]
-    curva_cdi = [float(v) for v in data.get("curva_cdi", [])]
     return ModelInputs(
         premissas=premissas,
-        datas=datas,
-        feriados=feriados,
-        curva_du=curva_du,
-        curva_cdi=curva_cdi,
+        datas=_parse_iso_dates(data.get("datas", [])),
+        feriados=_parse_iso_dates(data.get("feriados", [])),
+        curva_du=_float_tuple(data.get("curva_du", [])),
+        curva_cdi=_float_tuple(data.get("curva_cdi", [])),
     )
+
+
+def _read_json(path: Path) -> dict:
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def _float_tuple(values: List[float]) -> Tuple[float, ...]:
+    # Tuples keep ModelInputs comparable and hashable by value; build_flow turns them into arrays where used.
+    return tuple(np.asarray(values, dtype=np.float64).tolist())
+
+
+def _parse_iso_dates(values: List[str]) -> List[datetime]:
+    if not values:
+        return []
+    return pd.to_datetime(values, format="ISO8601").to_pydatetime().tolist()
@@ -22,7 +22,7 @@ ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
-from services.industry_anbima import build_public_anbima_fidc_mapping  # noqa: E402
+from services.industry_anbima import PUBLIC_WORKBOOK_COLUMNS, build_public_anbima_fidc_mapping  # noqa: E402
 
 
 DEFAULT_OUTPUT = Path("data/industry_study/industry_anbima_classification.csv.gz")
@@ -94,11 +94,25 @@ def _coverage_by_competence(mapping: pd.DataFrame, vehicle_path: Path) -> list[d
     return rows
 
 
+def _is_public_workbook_column(column: object) -> bool:
+    return column in PUBLIC_WORKBOOK_COLUMNS
+
+
+def _read_source_sheet(path: Path) -> pd.DataFrame:
+    # A callable usecols leaves missing columns to build_public_anbima_fidc_mapping's error.
+    # python-calamine is optional; openpyxl stays as the fallback reader.
+    options = {"sheet_name": "Consulta1", "dtype": str, "usecols": _is_public_workbook_column}
+    try:
+        return pd.read_excel(path, engine="calamine", **options)
+    except (ImportError, ValueError):
+        return pd.read_excel(path, engine="openpyxl", **options)
+
+
 def main() -> None:
     args = parse_args()
     if not args.source_xlsx.exists():
         raise SystemExit(f"Planilha ANBIMA não encontrada: {args.source_xlsx}")
-    source = pd.read_excel(args.source_xlsx, sheet_name="Consulta1", dtype=str)
+    source = _read_source_sheet(args.source_xlsx)
     mapping = build_public_anbima_fidc_mapping(source)
     mapping["source_snapshot_date"] = args.published_date
     args.output.parent.mkdir(parents=True, exist_ok=True)
@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+import sys
+
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from services.fidc_model.model_pack import extract_model_pack_json  # noqa: E402
+
+
+WORKBOOK_PATH = ROOT / "Modelo_Publico.xlsm"
+OUTPUT_PATH = ROOT / "model_pack_formulas.json"
+
+
+def main() -> None:
+    payload = extract_model_pack_json(WORKBOOK_PATH.read_bytes())
+    OUTPUT_PATH.write_bytes(payload)
+    model_pack = json.loads(payload)
+    formula_count = sum(len(cells) for cells in model_pack["cells"].values())
+    print(f"{formula_count} fórmulas em {len(model_pack['sheets'])} abas -> {OUTPUT_PATH.name}")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,11 +4,15 @@ import json
 from pathlib import Path
 
 from openpyxl import load_workbook
+from openpyxl.utils.cell import column_index_from_string, coordinate_from_string
 
 
 ROOT = Path(__file__).resolve().parents[1]
 WORKBOOK_PATH = ROOT / "Modelo_Publico (1).xlsm"
 OUTPUT_PATH = ROOT / "tests" / "fixtures" / "modelo_publico_fixture.json"
+FIRST_ROW = 4
+LAST_ROW = 28
+LAST_COLUMN = "AW"
 
 
 def _float_or_none(value):
@@ -22,36 +26,59 @@ def _float_or_none(value):
         return None
 
 
+def _read_fluxo_base_block() -> dict[int, tuple]:
+    # Cached values only: read-only mode streams the rows instead of building every cell object.
+    workbook = load_workbook(WORKBOOK_PATH, data_only=True, read_only=True)
+    try:
+        rows = workbook["Fluxo Base"].iter_rows(
+            min_row=FIRST_ROW,
+            max_row=LAST_ROW,
+            max_col=column_index_from_string(LAST_COLUMN),
+            values_only=True,
+        )
+        return dict(enumerate(rows, start=FIRST_ROW))
+    finally:
+        workbook.close()
+
+
+class _SheetValues:
+    def __init__(self, rows: dict[int, tuple]) -> None:
+        self._rows = rows
+
+    def __getitem__(self, coordinate: str):
+        column, row = coordinate_from_string(coordinate)
+        return self._rows[row][column_index_from_string(column) - 1]
+
+
 def main() -> None:
-    workbook = load_workbook(WORKBOOK_PATH, data_only=True, keep_vba=True)
-    sheet = workbook["Fluxo Base"]
+    sheet = _SheetValues(_read_fluxo_base_block())
 
     timeline = []
     for row in range(4, 21):
         timeline.append(
             {
-                "indice": int(sheet[f"E{row}"].value),
-                "data": sheet[f"F{row}"].value.date().isoformat(),
-                "dc": int(sheet[f"G{row}"].value),
-                "du": int(sheet[f"H{row}"].value),
-                "pre_di": _float_or_none(sheet[f"I{row}"].value),
-                "taxa_senior": _float_or_none(sheet[f"J{row}"].value),
-                "fra_senior": _float_or_none(sheet[f"K{row}"].value),
-                "taxa_mezz": _float_or_none(sheet[f"L{row}"].value),
-                "fra_mezz": _float_or_none(sheet[f"M{row}"].value),
-                "carteira": _float_or_none(sheet[f"O{row}"].value),
-                "fluxo_carteira": _float_or_none(sheet[f"Q{row}"].value),
-                "pl_fidc": _float_or_none(sheet[f"R{row}"].value),
-                "custos_adm": _float_or_none(sheet[f"T{row}"].value),
-                "inadimplencia_despesa": _float_or_none(sheet[f"U{row}"].value),
-                "pmt_senior": _float_or_none(sheet[f"Y{row}"].value),
-                "vp_pmt_senior": _float_or_none(sheet[f"Z{row}"].value),
-                "pl_senior": _float_or_none(sheet[f"AA{row}"].value),
-                "pmt_mezz": _float_or_none(sheet[f"AG{row}"].value),
-                "pl_mezz": _float_or_none(sheet[f"AH{row}"].value),
-                "pmt_sub_jr": _float_or_none(sheet[f"AN{row}"].value),
-                "pl_sub_jr": _float_or_none(sheet[f"AO{row}"].value),
-                "subordinacao_pct": _float_or_none(sheet[f"AW{row}"].value),
+                "indice": int(sheet[f"E{row}"]),
+                "data": sheet[f"F{row}"].date().isoformat(),
+                "dc": int(sheet[f"G{row}"]),
+                "du": int(sheet[f"H{row}"]),
+                "pre_di": _float_or_none(sheet[f"I{row}"]),
+                "taxa_senior": _float_or_none(sheet[f"J{row}"]),
+                "fra_senior": _float_or_none(sheet[f"K{row}"]),
+                "taxa_mezz": _float_or_none(sheet[f"L{row}"]),
+                "fra_mezz": _float_or_none(sheet[f"M{row}"]),
+                "carteira": _float_or_none(sheet[f"O{row}"]),
+                "fluxo_carteira": _float_or_none(sheet[f"Q{row}"]),
+                "pl_fidc": _float_or_none(sheet[f"R{row}"]),
+                "custos_adm": _float_or_none(sheet[f"T{row}"]),
+                "inadimplencia_despesa": _float_or_none(sheet[f"U{row}"]),
+                "pmt_senior": _float_or_none(sheet[f"Y{row}"]),
+                "vp_pmt_senior": _float_or_none(sheet[f"Z{row}"]),
+                "pl_senior": _float_or_none(sheet[f"AA{row}"]),
+                "pmt_mezz": _float_or_none(sheet[f"AG{row}"]),
+                "pl_mezz": _float_or_none(sheet[f"AH{row}"]),
+                "pmt_sub_jr": _float_or_none(sheet[f"AN{row}"]),
+                "pl_sub_jr": _float_or_none(sheet[f"AO{row}"]),
+                "subordinacao_pct": _float_or_none(sheet[f"AW{row}"]),
             }
         )
 
@@ -59,17 +86,16 @@ def main() -> None:
         "workbook": WORKBOOK_PATH.name,
         "sheet": "Fluxo Base",
         "kpis": {
-            "xirr_senior": _float_or_none(sheet["C17"].value),
-            "xirr_mezz": _float_or_none(sheet["C21"].value),
-            "xirr_sub_jr": _float_or_none(sheet["C24"].value),
-            "taxa_retorno_sub_jr_cdi": _float_or_none(sheet["C25"].value),
-            "duration_senior_anos": _float_or_none(sheet["C27"].value),
-            "pre_di_duration": _float_or_none(sheet["C28"].value),
+            "xirr_senior": _float_or_none(sheet["C17"]),
+            "xirr_mezz": _float_or_none(sheet["C21"]),
+            "xirr_sub_jr": _float_or_none(sheet["C24"]),
+            "taxa_retorno_sub_jr_cdi": _float_or_none(sheet["C25"]),
+            "duration_senior_anos": _float_or_none(sheet["C27"]),
+            "pre_di_duration": _float_or_none(sheet["C28"]),
         },
         "timeline": timeline,
     }
     OUTPUT_PATH.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
-    workbook.close()
 
 
 if __name__ == "__main__":
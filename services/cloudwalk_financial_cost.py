@@ -8,10 +8,11 @@ import math
 import re
 from typing import Any, Iterable
 
+import numpy as np
 import pandas as pd
 
 from services.fidc_model.b3_cdi import B3CdiMonthlyRate, compound_monthly_cdi
-from services.fidc_model.calendar import b3_market_holidays_for_dates, networkdays
+from services.fidc_model.calendar import b3_market_holidays_for_dates, holiday_array, networkdays
 from services.ime_loader import DEFAULT_PORTABLE_CACHE_ROOT, DEFAULT_RUNTIME_CACHE_ROOT, materialize_latest_portable_cache_for_cnpj
 from services.waterfall_schedule import (
     DEFAULT_CLOUDWALK_EMISSIONS,
@@ -489,7 +490,8 @@ def _parse_programmed_range_schedule(text: str, volume: float) -> tuple[str, lis
 
 
 def _line_and_monthly_rows(lines: list[FundingLine], config: CostRunConfig) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
-    holidays = b3_market_holidays_for_dates([config.start_date, config.end_date, config.snapshot_date])
+    # Converted once: every scheduled period of every line counts business days against the same holidays.
+    holidays = holiday_array(b3_market_holidays_for_dates([config.start_date, config.end_date, config.snapshot_date]))
     total_du = _business_days_between(config.start_date, config.end_date + timedelta(days=1), holidays)
     total_days = max((config.end_date - config.start_date).days + 1, 1)
     line_rows: list[dict[str, Any]] = []
@@ -543,7 +545,7 @@ def _line_and_monthly_rows(lines: list[FundingLine], config: CostRunConfig) -> t
     return line_rows, monthly_rows
 
 
-def _scheduled_cost(line: FundingLine, config: CostRunConfig, holidays: Iterable[date]) -> dict[str, Any]:
+def _scheduled_cost(line: FundingLine, config: CostRunConfig, holidays: np.ndarray) -> dict[str, Any]:
     total_days = max((config.end_date - config.start_date).days + 1, 1)
     if not line.included or not line.has_rate:
         return {"gross_cost": math.nan, "average_balance": _average_balance(line, config), "principal_paid": 0.0, "monthly_rows": []}
@@ -1068,7 +1070,7 @@ def _last_day(year: int, month: int) -> int:
     return (next_month - timedelta(days=1)).day
 
 
-def _business_days_between(start: date, end_exclusive: date, holidays: Iterable[date]) -> int:
+def _business_days_between(start: date, end_exclusive: date, holidays: Iterable[date] | np.ndarray) -> int:
     if end_exclusive <= start:
         return 0
     return networkdays(start, end_exclusive - timedelta(days=1), holidays)
@@ -1,4 +1,4 @@
-from .contracts import ModelKpis, PeriodResult, Premissas
+from .contracts import PERIOD_RESULT_FIELDS, ModelKpis, PeriodResult, Premissas, period_results_columns
 from .curves import INTERPOLATION_METHOD_FLAT_FORWARD_252, INTERPOLATION_METHOD_SPLINE
 from .engine import (
     AMORTIZATION_MODE_BULLET,
@@ -42,6 +42,7 @@ __all__ = [
     "PDD_METHOD_NPL90_STOCK",
     "RATE_MODE_POST_CDI",
     "RATE_MODE_PRE",
+    "PERIOD_RESULT_FIELDS",
     "ModelKpis",
     "PeriodResult",
     "Premissas",
@@ -51,4 +52,5 @@ __all__ = [
     "cession_discount_to_monthly_rate",
     "monthly_to_annual_252_rate",
     "monthly_rate_to_cession_discount",
+    "period_results_columns",
 ]
@@ -9,6 +9,9 @@ from typing import Iterable, Sequence
 from urllib.error import HTTPError, URLError
 from urllib.request import Request, urlopen
 
+import numpy as np
+import pandas as pd
+
 
 B3_TRADING_CALENDAR_URL = "https://www.b3.com.br/en_us/solutions/platforms/puma-trading-system/for-members-and-traders/trading-calendar/holidays/"
 B3_CALENDAR_MONTHS = {
@@ -45,17 +48,30 @@ def _as_date(value: date | datetime) -> date:
     return value.date() if isinstance(value, datetime) else value
 
 
-def networkdays(start: date, end: date, feriados: Iterable[date | datetime]) -> int:
-    if start > end:
-        start, end = end, start
-    feriados_set = {_as_date(holiday) for holiday in feriados}
-    day = start
-    total = 0
-    while day <= end:
-        if day.weekday() < 5 and day not in feriados_set:
-            total += 1
-        day = day.fromordinal(day.toordinal() + 1)
-    return total
+def _day_array(values: Iterable[date | datetime]) -> np.ndarray:
+    return pd.to_datetime(list(values)).to_numpy().astype("datetime64[D]")
+
+
+def holiday_array(feriados: Iterable[date | datetime]) -> np.ndarray:
+    """Sorted, deduplicated ``datetime64[D]`` holidays, reusable across :func:`networkdays` calls."""
+
+    return np.unique(_day_array(feriados))
+
+
+def _inclusive_busday_count(start: np.ndarray, end: np.ndarray, holidays: np.ndarray) -> np.ndarray:
+    first = np.minimum(start, end)
+    last = np.maximum(start, end)
+    return np.busday_count(first, last + np.timedelta64(1, "D"), holidays=holidays)
+
+
+def networkdays(start: date, end: date, feriados: Iterable[date | datetime] | np.ndarray) -> int:
+    holidays = feriados if isinstance(feriados, np.ndarray) else holiday_array(feriados)
+    counts = _inclusive_busday_count(
+        np.datetime64(_as_date(start), "D"),
+        np.datetime64(_as_date(end), "D"),
+        holidays.astype("datetime64[D]", copy=False),
+    )
+    return int(counts)
 
 
 def build_period_indexes(length: int) -> list[int]:
@@ -244,10 +260,8 @@ def build_day_counts(datas: Sequence[datetime], feriados: Iterable[date | dateti
     if not datas:
         return [], []
 
-    start_date = datas[0].date()
-    holiday_dates = [_as_date(holiday) for holiday in feriados]
-    dc = [(dt.date() - start_date).days for dt in datas]
-    du = [0]
-    for dt in datas[1:]:
-        du.append(networkdays(start_date, dt.date(), holiday_dates) - 1)
-    return dc, du
+    dates = _day_array(datas)
+    dc = (dates - dates[0]).astype(np.int64)
+    du = _inclusive_busday_count(dates[0], dates, holiday_array(feriados)) - 1
+    du[0] = 0
+    return dc.tolist(), du.tolist()
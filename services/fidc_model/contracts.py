@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from dataclasses import field
+from dataclasses import field, fields
 from datetime import datetime
-from typing import Optional
+from operator import attrgetter
+from typing import Optional, Sequence
 
 
 @dataclass(frozen=True)
@@ -68,7 +69,7 @@ class Premissas:
         return 1.0 - self.proporcao_senior - self.proporcao_mezz
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PeriodResult:
     indice: int
     data: datetime
@@ -158,6 +159,27 @@ class PeriodResult:
     subordinacao_pct_modelo: Optional[float] = field(default=None)
 
 
+PERIOD_RESULT_FIELDS: tuple[str, ...] = tuple(item.name for item in fields(PeriodResult))
+_PERIOD_RESULT_ROW = attrgetter(*PERIOD_RESULT_FIELDS)
+
+
+def period_results_columns(
+    periods: Sequence[PeriodResult],
+    names: Sequence[str] | None = None,
+) -> dict[str, list]:
+    """Column-oriented view of a flow: one list per ``PeriodResult`` field, in declaration order.
+
+    ``names`` restricts the view to those fields, in the given order, so callers that only need a few
+    columns do not extract the whole flow.
+    """
+
+    if names is not None:
+        return {name: [getattr(period, name) for period in periods] for name in names}
+    if not periods:
+        return {name: [] for name in PERIOD_RESULT_FIELDS}
+    return {name: list(column) for name, column in zip(PERIOD_RESULT_FIELDS, zip(*map(_PERIOD_RESULT_ROW, periods)))}
+
+
 @dataclass(frozen=True)
 class ModelKpis:
     xirr_senior: Optional[float]
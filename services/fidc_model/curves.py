@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import Sequence
 
+import numpy as np
+
 
 INTERPOLATION_METHOD_SPLINE = "spline"
 INTERPOLATION_METHOD_FLAT_FORWARD_252 = "flat_forward_252"
@@ -37,29 +41,69 @@ def _spline_coefficients(xs: Sequence[float], ys: Sequence[float]) -> tuple[list
     return a, b, c, d
 
 
-def cubic_spline(x: float, xs: Sequence[float], ys: Sequence[float]) -> float:
-    if len(xs) < 2:
-        return float(ys[0]) if ys else 0.0
+@dataclass(frozen=True)
+class SplineCoefficients:
+    """Natural cubic spline pieces ``a + b*dx + c*dx**2 + d*dx**3`` anchored at each vertex of ``xs``."""
+
+    xs: np.ndarray
+    a: np.ndarray
+    b: np.ndarray
+    c: np.ndarray
+    d: np.ndarray
+
+
+def prepare_spline(xs: Sequence[float], ys: Sequence[float]) -> SplineCoefficients:
+    """Spline coefficients for the curve, shared across calls that pass the same vertices."""
+
+    return _cached_spline(_float_tuple(xs), _float_tuple(ys))
+
+
+def _float_tuple(values: Sequence[float]) -> tuple[float, ...]:
+    return tuple(np.asarray(values, dtype=np.float64).tolist())
 
+
+def _read_only_array(values: Sequence[float]) -> np.ndarray:
+    array = np.array(values, dtype=np.float64)
+    array.flags.writeable = False
+    return array
+
+
+@lru_cache(maxsize=32)
+def _cached_spline(xs: tuple[float, ...], ys: tuple[float, ...]) -> SplineCoefficients:
     a, b, c, d = _spline_coefficients(xs, ys)
-    if x <= xs[0]:
-        slope = b[0]
-        return a[0] + slope * (x - xs[0])
-    if x >= xs[-1]:
-        span = xs[-1] - xs[-2]
-        slope = b[-1] + 2.0 * c[-1] * span + 3.0 * d[-1] * (span**2)
-        return a[-1] + slope * (x - xs[-1])
+    return SplineCoefficients(
+        xs=_read_only_array(xs),
+        a=_read_only_array(a),
+        b=_read_only_array(b),
+        c=_read_only_array(c),
+        d=_read_only_array(d),
+    )
+
+
+def evaluate_spline(spline: SplineCoefficients, x: Sequence[float] | np.ndarray) -> np.ndarray:
+    """Evaluate a prepared spline at every point of ``x``, extrapolating linearly outside the vertices."""
+
+    points = np.asarray(x, dtype=np.float64)
+    xs = spline.xs
+    index = np.clip(np.searchsorted(xs, points, side="left") - 1, 0, len(xs) - 2)
+    dx = points - xs[index]
+    values = spline.a[index] + spline.b[index] * dx + spline.c[index] * (dx**2) + spline.d[index] * (dx**3)
+
+    span = xs[-1] - xs[-2]
+    right_slope = spline.b[-1] + 2.0 * spline.c[-1] * span + 3.0 * spline.d[-1] * (span**2)
+    values = np.where(points >= xs[-1], spline.a[-1] + right_slope * (points - xs[-1]), values)
+    return np.where(points <= xs[0], spline.a[0] + spline.b[0] * (points - xs[0]), values)
+
 
-    i = 0
-    while i < len(xs) - 1 and xs[i + 1] < x:
-        i += 1
-    dx = x - xs[i]
-    return a[i] + b[i] * dx + c[i] * (dx**2) + d[i] * (dx**3)
+def cubic_spline(x: float, xs: Sequence[float], ys: Sequence[float]) -> float:
+    if len(xs) < 2:
+        return float(ys[0]) if len(ys) else 0.0
+    return float(evaluate_spline(prepare_spline(xs, ys), x))
 
 
 def flat_forward_252(x: float, xs: Sequence[float], ys: Sequence[float]) -> float:
     if len(xs) < 2:
-        return float(ys[0]) if ys else 0.0
+        return float(ys[0]) if len(ys) else 0.0
     if x <= 0:
         return float(ys[0])
 
@@ -88,6 +132,40 @@ def flat_forward_252(x: float, xs: Sequence[float], ys: Sequence[float]) -> floa
     return interpolated_factor ** (252.0 / x) - 1.0
 
 
+def flat_forward_252_points(x: Sequence[float] | np.ndarray, xs: Sequence[float], ys: Sequence[float]) -> np.ndarray:
+    """Vectorized :func:`flat_forward_252`: one segment lookup and factor interpolation for all points."""
+
+    points = np.asarray(x, dtype=np.float64)
+    if len(xs) < 2:
+        return np.full(points.shape, float(ys[0]) if len(ys) else 0.0)
+    vertices = np.asarray(xs, dtype=np.float64)
+    rates = np.asarray(ys, dtype=np.float64)
+
+    index = np.clip(np.searchsorted(vertices, points, side="left") - 1, 0, len(vertices) - 2)
+    # Same precedence as the scalar lookup: the left edge wins over the right edge on degenerate curves.
+    index = np.where(points >= vertices[-1], len(vertices) - 2, index)
+    index = np.where(points <= vertices[0], 0, index)
+    left_du = vertices[index]
+    right_du = vertices[index + 1]
+    left_rate = rates[index]
+    right_rate = rates[index + 1]
+    flat = (points <= 0) | (right_du == left_du)
+    if np.any(~flat & ((left_rate <= -1.0) | (right_rate <= -1.0))):
+        raise ValueError("Flat Forward 252 exige taxas maiores que -100%.")
+
+    with np.errstate(divide="ignore", over="ignore", invalid="ignore"):
+        left_factor = (1.0 + left_rate) ** (left_du / 252.0)
+        right_factor = (1.0 + right_rate) ** (right_du / 252.0)
+        weight = (points - left_du) / (right_du - left_du)
+        interpolated_factor = left_factor * ((right_factor / left_factor) ** weight)
+        values = interpolated_factor ** (252.0 / points) - 1.0
+    if not np.all(np.isfinite(values) | flat):
+        # The scalar path raises on float overflow; keep that instead of returning inf/nan rates.
+        raise OverflowError("Flat Forward 252: fator acumulado fora da faixa numérica.")
+    values = np.where(right_du == left_du, left_rate, values)
+    return np.where(points <= 0, rates[0], values)
+
+
 def interpolate_curve(
     x: float,
     xs: Sequence[float],
@@ -100,3 +178,21 @@ def interpolate_curve(
     if method == INTERPOLATION_METHOD_SPLINE:
         return cubic_spline(x, xs, ys)
     raise ValueError(f"Metodologia de interpolação inválida: {method}")
+
+
+def interpolate_curve_points(
+    x: Sequence[float],
+    xs: Sequence[float],
+    ys: Sequence[float],
+    *,
+    method: str = INTERPOLATION_METHOD_SPLINE,
+) -> np.ndarray:
+    """Batch form of :func:`interpolate_curve`; the spline is prepared once for all points."""
+
+    if method == INTERPOLATION_METHOD_FLAT_FORWARD_252:
+        return flat_forward_252_points(x, xs, ys)
+    if method == INTERPOLATION_METHOD_SPLINE:
+        if len(xs) < 2:
+            return np.full(len(x), float(ys[0]) if len(ys) else 0.0)
+        return evaluate_spline(prepare_spline(xs, ys), x)
+    raise ValueError(f"Metodologia de interpolação inválida: {method}")
@@ -1,13 +1,16 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, replace
+from dataclasses import dataclass
 from datetime import datetime
+from operator import attrgetter
 from typing import Iterable, Sequence
 
+import numpy as np
+
 from .calendar import build_day_counts, build_period_indexes
 from .contracts import ModelKpis, PeriodResult, Premissas
-from .curves import INTERPOLATION_METHOD_SPLINE, interpolate_curve
-from .metrics import calculate_duration_years, lookup_pre_di_duration, xirr
+from .curves import INTERPOLATION_METHOD_SPLINE, interpolate_curve_points
+from .metrics import calculate_duration_years, lookup_pre_di_duration, xirr_from_year_fractions, year_fractions
 
 
 RATE_MODE_POST_CDI = "pos_cdi"
@@ -76,9 +79,9 @@ def _ead_factor_for_premissas(premissas: Premissas, rate_am: float, term_months:
     return _price_paid_factor_from_monthly_rate(rate_am, term_months)
 
 
-def _cession_floor_monthly_rate(senior_annual_rate: float, excess_spread_am: float) -> float:
+def _cession_floor_monthly_rate(senior_annual_rate: np.ndarray, excess_spread_am: float) -> np.ndarray:
     excess_annual_rate = monthly_to_annual_252_rate(max(excess_spread_am, 0.0))
-    floor_annual_rate = max(senior_annual_rate, -0.999999) + excess_annual_rate
+    floor_annual_rate = np.maximum(senior_annual_rate, -0.999999) + excess_annual_rate
     return annual_252_to_monthly_rate(floor_annual_rate)
 
 
@@ -90,13 +93,21 @@ def _class_annual_rate(base_rate: float, class_rate: float, mode: str) -> float:
     raise ValueError(f"Tipo de taxa de cota inválido: {mode}")
 
 
-def _admin_cost_period_amount(pl_start: float, cost_aa: float, cost_min_monthly: float) -> float:
-    monthly_cost_rate = (1.0 + max(float(cost_aa), -0.999999)) ** (1.0 / 12.0) - 1.0
+def _admin_cost_monthly_rate(cost_aa: float) -> float:
+    return (1.0 + max(float(cost_aa), -0.999999)) ** (1.0 / 12.0) - 1.0
+
+
+def _admin_cost_from_monthly_rate(pl_start: float, monthly_cost_rate: float, cost_min_monthly: float) -> float:
     return max(max(float(pl_start), 0.0) * monthly_cost_rate, float(cost_min_monthly))
 
 
-def _months_between(start: datetime, current: datetime) -> int:
-    return (current.year - start.year) * 12 + (current.month - start.month)
+def _admin_cost_period_amount(pl_start: float, cost_aa: float, cost_min_monthly: float) -> float:
+    return _admin_cost_from_monthly_rate(pl_start, _admin_cost_monthly_rate(cost_aa), cost_min_monthly)
+
+
+def _month_deltas(datas: Sequence[datetime]) -> list[int]:
+    months = np.array(datas, dtype="datetime64[M]")
+    return (months - months[0]).astype(np.int64).tolist()
 
 
 def _term_months(term_years: float | None, fallback_months: int) -> int:
@@ -123,7 +134,7 @@ def _principal_schedule(
     if mode == AMORTIZATION_MODE_NONE:
         return schedule
 
-    month_deltas = [_months_between(datas[0], dt) for dt in datas]
+    month_deltas = _month_deltas(datas)
     last_month = month_deltas[-1]
     final_month = term_months if term_months is not None else last_month
 
@@ -641,12 +652,12 @@ def _selic_annual_rate_for_year(premissas: Premissas, year: int) -> float:
     return max(float(projection[year]), -0.999999)
 
 
-def _period_month_fraction(month_deltas: Sequence[int], index: int, delta_dc: int) -> float:
-    if index > 0:
-        delta_months = month_deltas[index] - month_deltas[index - 1]
-        if delta_months > 0:
-            return float(delta_months)
-    return max(float(delta_dc) / 30.0, 0.0)
+def _period_month_fractions(month_deltas: Sequence[int], delta_dc: np.ndarray) -> list[float]:
+    """Whole calendar months per period, falling back to DC/30 when the period stays in the same month."""
+
+    delta_months = np.diff(np.asarray(month_deltas, dtype=np.int64), prepend=month_deltas[0])
+    fallback = np.maximum(delta_dc / 30.0, 0.0)
+    return np.where(delta_months > 0, delta_months.astype(np.float64), fallback).tolist()
 
 
 def _reinvestment_cutoff_month(premissas: Premissas, fallback_term_months: int) -> float:
@@ -678,12 +689,106 @@ def _revolving_portfolio_limit(premissas: Premissas, month_delta: int = 0) -> fl
     return min(limits) if limits else None
 
 
-def _period_indexes_for_dates(datas: Sequence[datetime]) -> list[int]:
-    month_deltas = [_months_between(datas[0], dt) for dt in datas]
+def _period_indexes_for_month_deltas(month_deltas: Sequence[int]) -> list[int]:
     workbook_prefix = [0, 6, 12, 18, 24]
     if len(month_deltas) >= len(workbook_prefix) and month_deltas[: len(workbook_prefix)] == workbook_prefix:
-        return build_period_indexes(len(datas))
-    return month_deltas
+        return build_period_indexes(len(month_deltas))
+    return list(month_deltas)
+
+
+@dataclass(frozen=True)
+class _PeriodCashInputs:
+    """Period amounts that do not depend on how much principal is reinvested."""
+
+    principal_recebido_carteira: float
+    saldo_caixa_selic_inicio: float
+    taxa_selic_periodo: float
+    fluxo_carteira: float
+    recuperacao_credito: float
+    custos_adm: float
+    inadimplencia_despesa: float
+    pmt_senior: float
+    pmt_mezz: float
+    pl_fidc_inicio: float
+    pl_senior_fim: float
+    pl_mezz_fim: float
+
+
+def _period_cash_values(
+    inputs: _PeriodCashInputs,
+    reinvestimento_principal_periodo: float,
+) -> tuple[float, float, float, float, float, float, float]:
+    principal_recebido = inputs.principal_recebido_carteira
+    principal_selic = max(principal_recebido - min(reinvestimento_principal_periodo, principal_recebido), 0.0)
+    rendimento_selic = (inputs.saldo_caixa_selic_inicio + principal_selic) * inputs.taxa_selic_periodo
+    fluxo_total = inputs.fluxo_carteira + rendimento_selic + inputs.recuperacao_credito
+    fluxo_apos_senior = fluxo_total - inputs.custos_adm - inputs.inadimplencia_despesa - inputs.pmt_senior
+    fluxo_apos_mezz = fluxo_apos_senior - inputs.pmt_mezz
+    pl_fidc_fim = (
+        inputs.pl_fidc_inicio
+        + fluxo_total
+        - inputs.custos_adm
+        - inputs.inadimplencia_despesa
+        - inputs.pmt_senior
+        - inputs.pmt_mezz
+    )
+    pl_sub_fim = pl_fidc_fim - inputs.pl_senior_fim - inputs.pl_mezz_fim
+    return principal_selic, rendimento_selic, fluxo_total, fluxo_apos_senior, fluxo_apos_mezz, pl_fidc_fim, pl_sub_fim
+
+
+def _class_rate_curve(base_rates: np.ndarray, class_rate: float, mode: str) -> np.ndarray:
+    rates = _class_annual_rate(base_rates, class_rate, mode)
+    return np.broadcast_to(np.asarray(rates, dtype=np.float64), base_rates.shape).copy()
+
+
+def _forward_rate_curve(rates: np.ndarray, du: np.ndarray) -> np.ndarray:
+    """Annual forward rate between consecutive vertices; periods without new DU keep the spot rate."""
+
+    forwards = rates.copy()
+    if len(rates) < 3:
+        return forwards
+    delta_du = du[2:] - du[1:-1]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        growth = (1.0 + rates[2:]) ** (du[2:] / 252.0) / (1.0 + rates[1:-1]) ** (du[1:-1] / 252.0)
+        forwards[2:] = np.where(delta_du == 0, rates[2:], growth ** (252.0 / delta_du) - 1.0)
+    return forwards
+
+
+def _period_values(curve: np.ndarray) -> list[float | None]:
+    return [None, *curve[1:].tolist()] if len(curve) else []
+
+
+@dataclass(frozen=True)
+class _AccrualSchedule:
+    """Per-period growth factors that depend only on the curve, the calendar and the premissas."""
+
+    fator_juros_senior: list[float]
+    fator_juros_mezz: list[float]
+    tx_cessao_am_piso: list[float]
+    tx_cessao_am_aplicada: list[float]
+    fator_carteira: list[float]
+    desconto_senior: list[float | None]
+
+
+def _accrual_schedule(
+    du: np.ndarray,
+    delta_du: np.ndarray,
+    taxa_senior: np.ndarray,
+    fra_senior: np.ndarray,
+    fra_mezz: np.ndarray,
+    premissas: Premissas,
+) -> _AccrualSchedule:
+    delta_du = delta_du[1:]
+    piso = _cession_floor_monthly_rate(fra_senior[1:], premissas.excesso_spread_senior_am)
+    aplicada = np.maximum(premissas.tx_cessao_am, piso)
+    return _AccrualSchedule(
+        fator_juros_senior=[0.0, *((1.0 + fra_senior[1:]) ** (delta_du / 252.0) - 1.0).tolist()],
+        fator_juros_mezz=[0.0, *((1.0 + fra_mezz[1:]) ** (delta_du / 252.0) - 1.0).tolist()],
+        tx_cessao_am_piso=[0.0, *piso.tolist()],
+        tx_cessao_am_aplicada=[premissas.tx_cessao_am, *aplicada.tolist()],
+        fator_carteira=[0.0, *((1.0 + aplicada) ** (delta_du / 21.0) - 1.0).tolist()],
+        desconto_senior=_period_values((1.0 + taxa_senior) ** (du / 252.0)),
+    )
 
 
 def build_flow(
@@ -696,54 +801,42 @@ def build_flow(
 ) -> list[PeriodResult]:
     if not datas:
         return []
-    if not curva_du or not curva_cdi:
+    if len(curva_du) == 0 or len(curva_cdi) == 0:
         raise ValueError("Curva DI/Pre vazia: o modelo exige uma curva válida da fonte selecionada.")
 
-    period_indexes = _period_indexes_for_dates(datas)
     dc, du = build_day_counts(datas, feriados)
-    month_deltas = [_months_between(datas[0], dt) for dt in datas]
-
-    zero_pre_di: list[float | None] = [None]
-    for du_value in du[1:]:
-        zero_pre_di.append(interpolate_curve(float(du_value), curva_du, curva_cdi, method=interpolation_method))
-
-    taxa_senior: list[float | None] = [None]
-    taxa_mezz: list[float | None] = [None]
-    for index in range(1, len(datas)):
-        base_rate = zero_pre_di[index]
-        assert base_rate is not None
-        taxa_senior.append(_class_annual_rate(base_rate, premissas.taxa_senior, premissas.tipo_taxa_senior))
-        taxa_mezz.append(_class_annual_rate(base_rate, premissas.taxa_mezz, premissas.tipo_taxa_mezz))
-
-    fra_senior: list[float | None] = [None]
-    fra_mezz: list[float | None] = [None]
-    for index in range(1, len(datas)):
-        if index == 1:
-            fra_senior.append(taxa_senior[index])
-            fra_mezz.append(taxa_mezz[index])
-            continue
-        if du[index] == du[index - 1]:
-            fra_senior.append(taxa_senior[index])
-            fra_mezz.append(taxa_mezz[index])
-            continue
-        current_senior = taxa_senior[index]
-        previous_senior = taxa_senior[index - 1]
-        current_mezz = taxa_mezz[index]
-        previous_mezz = taxa_mezz[index - 1]
-        if previous_senior is None or previous_mezz is None or current_senior is None or current_mezz is None:
-            fra_senior.append(None)
-            fra_mezz.append(None)
-            continue
-        fra_senior.append(
-            ((1.0 + current_senior) ** (du[index] / 252.0) / (1.0 + previous_senior) ** (du[index - 1] / 252.0))
-            ** (252.0 / (du[index] - du[index - 1]))
-            - 1.0
-        )
-        fra_mezz.append(
-            ((1.0 + current_mezz) ** (du[index] / 252.0) / (1.0 + previous_mezz) ** (du[index - 1] / 252.0))
-            ** (252.0 / (du[index] - du[index - 1]))
-            - 1.0
-        )
+    month_deltas = _month_deltas(datas)
+    period_indexes = _period_indexes_for_month_deltas(month_deltas)
+
+    # Period-over-period day counts, computed once for the accruals and the loop (index 0 has none).
+    dc_array = np.asarray(dc, dtype=np.int64)
+    du_array = np.asarray(du, dtype=np.int64)
+    delta_dc_curve = np.diff(dc_array, prepend=dc_array[:1])
+    delta_du_curve = np.diff(du_array, prepend=du_array[:1])
+    delta_dc_values = delta_dc_curve.tolist()
+    delta_du_values = delta_du_curve.tolist()
+    period_months_values = _period_month_fractions(month_deltas, delta_dc_curve)
+
+    du_curve = np.asarray(du, dtype=np.float64)
+    zero_pre_di_curve = np.full(len(datas), np.nan)
+    zero_pre_di_curve[1:] = interpolate_curve_points(du_curve[1:], curva_du, curva_cdi, method=interpolation_method)
+    taxa_senior_curve = _class_rate_curve(zero_pre_di_curve, premissas.taxa_senior, premissas.tipo_taxa_senior)
+    taxa_mezz_curve = _class_rate_curve(zero_pre_di_curve, premissas.taxa_mezz, premissas.tipo_taxa_mezz)
+    fra_senior_curve = _forward_rate_curve(taxa_senior_curve, du_curve)
+    fra_mezz_curve = _forward_rate_curve(taxa_mezz_curve, du_curve)
+    accruals = _accrual_schedule(
+        du_curve,
+        delta_du_curve.astype(np.float64),
+        taxa_senior_curve,
+        fra_senior_curve,
+        fra_mezz_curve,
+        premissas,
+    )
+    zero_pre_di = _period_values(zero_pre_di_curve)
+    taxa_senior = _period_values(taxa_senior_curve)
+    taxa_mezz = _period_values(taxa_mezz_curve)
+    fra_senior = _period_values(fra_senior_curve)
+    fra_mezz = _period_values(fra_mezz_curve)
 
     agio_aquisicao_despesa = max(premissas.volume * max(premissas.agio_aquisicao, 0.0), 0.0)
     pl_senior_initial = premissas.volume * premissas.proporcao_senior
@@ -771,7 +864,22 @@ def build_flow(
         term_months=mezz_term_months,
     )
 
-    periods: list[PeriodResult] = []
+    # Loop invariants: these depend only on premissas and the date grid, not on the running balances.
+    last_index = len(datas) - 1
+    fidc_term_months = _term_months(premissas.prazo_fidc_anos, fallback_term_months)
+    prazo_medio_recebiveis = max(float(premissas.prazo_medio_recebiveis_meses), 0.01)
+    prazo_principal_recebiveis = max(
+        float(premissas.qtd_parcelas_media or premissas.prazo_medio_recebiveis_meses),
+        0.01,
+    )
+    subordinacao_minima_reinvestimento = max(float(premissas.subordinacao_minima_reinvestimento), 0.0)
+    custo_adm_taxa_mensal = _admin_cost_monthly_rate(premissas.custo_adm_aa)
+    custo_adm_minimo = float(premissas.custo_min)
+    preco_pago_fator_inicial = _ead_factor_for_premissas(premissas, premissas.tx_cessao_am, prazo_medio_recebiveis)
+
+    # Field values are collected per period and each PeriodResult is built once, after the loop,
+    # because the displayed residual of a period depends on the next period's junior PL.
+    period_fields: list[dict[str, object]] = []
     pl_senior_atual = pl_senior_initial
     pl_mezz_atual = pl_mezz_initial
     pl_fidc_atual = premissas.volume
@@ -786,8 +894,8 @@ def build_flow(
 
     for index, dt in enumerate(datas):
         if index == 0:
-            periods.append(
-                PeriodResult(
+            period_fields.append(
+                dict(
                     indice=period_indexes[index],
                     data=dt,
                     dc=dc[index],
@@ -800,12 +908,7 @@ def build_flow(
                     taxa_mezz=None,
                     fra_mezz=None,
                     carteira=premissas.volume,
-                    ead_carteira=premissas.volume
-                    * _ead_factor_for_premissas(
-                        premissas,
-                        premissas.tx_cessao_am,
-                        max(float(premissas.prazo_medio_recebiveis_meses), 0.01),
-                    ),
+                    ead_carteira=premissas.volume * preco_pago_fator_inicial,
                     fluxo_carteira=0.0,
                     taxa_selic_aa=None,
                     taxa_selic_periodo=0.0,
@@ -839,10 +942,10 @@ def build_flow(
                     bucket_61_90=0.0,
                     bucket_90_plus=0.0,
                     resultado_carteira_liquido=0.0,
-                    prazo_restante_reinvestimento_meses=float(_term_months(premissas.prazo_fidc_anos, fallback_term_months)),
+                    prazo_restante_reinvestimento_meses=float(fidc_term_months),
                     reinvestimento_elegivel=premissas.carteira_revolvente,
                     limite_carteira_revolvente=limite_carteira_revolvente,
-                    subordinacao_minima_reinvestimento=max(float(premissas.subordinacao_minima_reinvestimento), 0.0),
+                    subordinacao_minima_reinvestimento=subordinacao_minima_reinvestimento,
                     carteira_originada_acumulada=carteira_originada_acumulada,
                     capacidade_reinvestimento_subordinacao=0.0,
                     reinvestimento_bloqueado_subordinacao=0.0,
@@ -856,11 +959,7 @@ def build_flow(
                     caixa_nao_reinvestido=0.0,
                     saldo_caixa_selic_fim=0.0,
                     agio_aquisicao_despesa=agio_aquisicao_despesa,
-                    preco_pago_fator=_ead_factor_for_premissas(
-                        premissas,
-                        premissas.tx_cessao_am,
-                        max(float(premissas.prazo_medio_recebiveis_meses), 0.01),
-                    ),
+                    preco_pago_fator=preco_pago_fator_inicial,
                     tx_cessao_am_input=premissas.tx_cessao_am,
                     tx_cessao_am_piso=0.0,
                     tx_cessao_am_aplicada=premissas.tx_cessao_am,
@@ -883,41 +982,30 @@ def build_flow(
                     colchao_originada_pct=(
                         pl_sub_jr_initial / carteira_originada_acumulada if carteira_originada_acumulada else None
                     ),
-                    pl_sub_jr_modelo=None,
-                    subordinacao_pct_modelo=None,
                 )
             )
             continue
 
-        delta_du = du[index] - du[index - 1]
-        delta_dc = dc[index] - dc[index - 1]
+        delta_du = delta_du_values[index]
+        delta_dc = delta_dc_values[index]
         carteira = max(carteira_atual if premissas.carteira_revolvente else pl_fidc_atual, 0.0)
-        fra_senior_period = fra_senior[index] or 0.0
-        tx_cessao_am_piso = _cession_floor_monthly_rate(
-            fra_senior_period,
-            premissas.excesso_spread_senior_am,
-        )
-        tx_cessao_am_aplicada = max(premissas.tx_cessao_am, tx_cessao_am_piso)
-        period_months = _period_month_fraction(month_deltas, index, delta_dc)
+        tx_cessao_am_piso = accruals.tx_cessao_am_piso[index]
+        tx_cessao_am_aplicada = accruals.tx_cessao_am_aplicada[index]
+        period_months = period_months_values[index]
         limite_carteira_revolvente = (
             _revolving_portfolio_limit(premissas, month_deltas[index]) if premissas.carteira_revolvente else None
         )
-        prazo_medio_recebiveis = max(float(premissas.prazo_medio_recebiveis_meses), 0.01)
-        prazo_principal_recebiveis = max(
-            float(premissas.qtd_parcelas_media or premissas.prazo_medio_recebiveis_meses),
-            0.01,
-        )
         preco_pago_fator = _ead_factor_for_premissas(premissas, tx_cessao_am_aplicada, prazo_medio_recebiveis)
         ead_carteira = carteira * preco_pago_fator
         principal_programado_carteira = min(carteira, max(carteira * period_months / prazo_principal_recebiveis, 0.0))
         ead_vencendo = principal_programado_carteira * preco_pago_fator
         prazo_restante_reinvestimento = max(
-            float(_term_months(premissas.prazo_fidc_anos, fallback_term_months) - month_deltas[index]),
+            float(fidc_term_months - month_deltas[index]),
             0.0,
         )
         reinvestimento_elegivel = _is_reinvestment_eligible(premissas, month_deltas[index], fallback_term_months)
-        fluxo_carteira = carteira * ((1.0 + tx_cessao_am_aplicada) ** (delta_du / 21.0) - 1.0)
-        custos_adm = _admin_cost_period_amount(pl_fidc_atual, premissas.custo_adm_aa, premissas.custo_min)
+        fluxo_carteira = carteira * accruals.fator_carteira[index]
+        custos_adm = _admin_cost_from_monthly_rate(pl_fidc_atual, custo_adm_taxa_mensal, custo_adm_minimo)
         credit = _credit_period(
             carteira=ead_carteira,
             carteira_vencendo=ead_vencendo,
@@ -938,9 +1026,8 @@ def build_flow(
         perda_carteira_despesa = credit.perda_carteira_despesa
         inadimplencia_despesa = perda_carteira_despesa
 
-        fra_mezz_period = fra_mezz[index] or 0.0
-        juros_senior_bruto = pl_senior_atual * ((1.0 + fra_senior_period) ** (delta_du / 252.0) - 1.0)
-        juros_mezz_bruto = pl_mezz_atual * ((1.0 + fra_mezz_period) ** (delta_du / 252.0) - 1.0)
+        juros_senior_bruto = pl_senior_atual * accruals.fator_juros_senior[index]
+        juros_mezz_bruto = pl_mezz_atual * accruals.fator_juros_mezz[index]
         juros_senior, accrued_interest_senior = _interest_payment(
             juros_senior_bruto,
             accrued_interest_senior,
@@ -948,7 +1035,7 @@ def build_flow(
             month_delta=month_deltas[index],
             start_month=premissas.inicio_amortizacao_senior_meses,
             term_month=senior_term_months,
-            is_last_period=index == len(datas) - 1,
+            is_last_period=index == last_index,
         )
         juros_mezz, accrued_interest_mezz = _interest_payment(
             juros_mezz_bruto,
@@ -957,7 +1044,7 @@ def build_flow(
             month_delta=month_deltas[index],
             start_month=premissas.inicio_amortizacao_mezz_meses,
             term_month=mezz_term_months,
-            is_last_period=index == len(datas) - 1,
+            is_last_period=index == last_index,
         )
 
         principal_senior_period = max(principal_senior[index], 0.0)
@@ -969,19 +1056,22 @@ def build_flow(
         pl_mezz_fim = pl_mezz_atual - principal_mezz_period
         reinvestimento_principal_desejado = principal_recebido_carteira if reinvestimento_elegivel else 0.0
 
-        def _period_cash_values(reinvestimento_principal_periodo: float) -> tuple[float, float, float, float, float, float, float]:
-            principal_selic = max(principal_recebido_carteira - min(reinvestimento_principal_periodo, principal_recebido_carteira), 0.0)
-            rendimento_selic = (saldo_caixa_selic_inicio + principal_selic) * taxa_selic_periodo
-            fluxo_total = fluxo_carteira + rendimento_selic + credit.recuperacao_credito
-            fluxo_apos_senior = fluxo_total - custos_adm - inadimplencia_despesa - pmt_senior
-            fluxo_apos_mezz = fluxo_apos_senior - pmt_mezz
-            pl_fidc_fim = pl_fidc_atual + fluxo_total - custos_adm - inadimplencia_despesa - pmt_senior - pmt_mezz
-            pl_sub_fim = pl_fidc_fim - pl_senior_fim - pl_mezz_fim
-            return principal_selic, rendimento_selic, fluxo_total, fluxo_apos_senior, fluxo_apos_mezz, pl_fidc_fim, pl_sub_fim
-
-        prelim_values = _period_cash_values(reinvestimento_principal_desejado)
+        period_cash = _PeriodCashInputs(
+            principal_recebido_carteira=principal_recebido_carteira,
+            saldo_caixa_selic_inicio=saldo_caixa_selic_inicio,
+            taxa_selic_periodo=taxa_selic_periodo,
+            fluxo_carteira=fluxo_carteira,
+            recuperacao_credito=credit.recuperacao_credito,
+            custos_adm=custos_adm,
+            inadimplencia_despesa=inadimplencia_despesa,
+            pmt_senior=pmt_senior,
+            pmt_mezz=pmt_mezz,
+            pl_fidc_inicio=pl_fidc_atual,
+            pl_senior_fim=pl_senior_fim,
+            pl_mezz_fim=pl_mezz_fim,
+        )
+        prelim_values = _period_cash_values(period_cash, reinvestimento_principal_desejado)
         reinvestimento_excesso_desejado = max(prelim_values[4], 0.0) if reinvestimento_elegivel else 0.0
-        subordinacao_minima_reinvestimento = max(float(premissas.subordinacao_minima_reinvestimento), 0.0)
         compra_carteira_desejada = reinvestimento_principal_desejado + reinvestimento_excesso_desejado
         capacidade_reinvestimento_subordinacao = compra_carteira_desejada
         reinvestimento_bloqueado_subordinacao = 0.0
@@ -1012,7 +1102,7 @@ def build_flow(
             fluxo_remanescente_mezz,
             pl_fidc_atual,
             pl_sub_jr,
-        ) = _period_cash_values(reinvestimento_principal)
+        ) = _period_cash_values(period_cash, reinvestimento_principal)
         compra_carteira_periodo = reinvestimento_principal + reinvestimento_excesso
         nova_originacao = compra_carteira_periodo
         carteira_fim = carteira_apos_recebimento_e_baixa + compra_carteira_periodo
@@ -1038,13 +1128,13 @@ def build_flow(
         pl_senior_atual = pl_senior_fim
         pl_mezz_atual = pl_mezz_fim
 
-        taxa_senior_period = taxa_senior[index]
+        desconto_senior = accruals.desconto_senior[index]
         vp_pmt_senior = 0.0
-        if taxa_senior_period is not None:
-            vp_pmt_senior = pmt_senior / ((1.0 + taxa_senior_period) ** (du[index] / 252.0))
+        if desconto_senior is not None:
+            vp_pmt_senior = pmt_senior / desconto_senior
 
-        periods.append(
-            PeriodResult(
+        period_fields.append(
+            dict(
                 indice=period_indexes[index],
                 data=dt,
                 dc=dc[index],
@@ -1129,39 +1219,35 @@ def build_flow(
                 pl_sub_jr=pl_sub_jr,
                 subordinacao_pct=(pl_sub_jr / pl_fidc_atual) if pl_fidc_atual else None,
                 colchao_originada_pct=(pl_sub_jr / carteira_originada_acumulada) if carteira_originada_acumulada else None,
-                pl_sub_jr_modelo=None,
-                subordinacao_pct_modelo=None,
             )
         )
 
-    residual_modelo: list[float | None] = [None] * len(periods)
-    for index, period in enumerate(periods):
+    periods: list[PeriodResult] = []
+    for index, values in enumerate(period_fields):
         if index == 0:
-            residual_modelo[index] = None
-            continue
-        if index == 1:
-            residual_modelo[index] = period.pl_sub_jr
-            continue
-        if index == len(periods) - 1:
-            residual_modelo[index] = 0.0
-            continue
-        residual_modelo[index] = periods[index + 1].pl_sub_jr
-
-    periodos_ajustados: list[PeriodResult] = []
-    for index, period in enumerate(periods):
-        residual_exibido = residual_modelo[index]
+            residual_exibido = None
+        elif index == 1:
+            residual_exibido = values["pl_sub_jr"]
+        elif index == last_index:
+            residual_exibido = 0.0
+        else:
+            residual_exibido = period_fields[index + 1]["pl_sub_jr"]
+        pl_fidc = values["pl_fidc"]
         subordinacao_modelo = None
-        if residual_exibido is not None and period.pl_fidc:
-            subordinacao_modelo = residual_exibido / period.pl_fidc
-        periodos_ajustados.append(
-            replace(
-                period,
+        if residual_exibido is not None and pl_fidc:
+            subordinacao_modelo = residual_exibido / pl_fidc
+        periods.append(
+            PeriodResult(
+                **values,
                 pl_sub_jr_modelo=residual_exibido,
                 subordinacao_pct_modelo=subordinacao_modelo,
             )
         )
 
-    return periodos_ajustados
+    return periods
+
+
+_KPI_LEG_FIELDS = attrgetter("data", "pmt_senior", "pmt_mezz", "pmt_sub_jr")
 
 
 def build_kpis(periods: Sequence[PeriodResult]) -> ModelKpis:
@@ -1175,9 +1261,11 @@ def build_kpis(periods: Sequence[PeriodResult]) -> ModelKpis:
             pre_di_duration=None,
         )
 
-    xirr_senior = xirr([(period.data, period.pmt_senior) for period in periods])
-    xirr_mezz = xirr([(period.data, period.pmt_mezz) for period in periods])
-    xirr_sub_jr = xirr([(period.data, period.pmt_sub_jr) for period in periods])
+    datas, pmt_senior, pmt_mezz, pmt_sub_jr = zip(*map(_KPI_LEG_FIELDS, periods))
+    years = year_fractions(datas)
+    xirr_senior = xirr_from_year_fractions(pmt_senior, years)
+    xirr_mezz = xirr_from_year_fractions(pmt_mezz, years)
+    xirr_sub_jr = xirr_from_year_fractions(pmt_sub_jr, years)
     duration_senior_anos = calculate_duration_years(periods)
     pre_di_duration = lookup_pre_di_duration(periods, duration_senior_anos)
     taxa_retorno_sub_jr_cdi = None
@@ -4,87 +4,114 @@ from datetime import datetime
 from math import isfinite
 from typing import Optional, Sequence
 
+import numpy as np
+
 from .contracts import PeriodResult
 
 
 def xirr(cashflows: Sequence[tuple[datetime, float]], guess: float = 0.1) -> Optional[float]:
     if not cashflows:
         return None
+    return xirr_from_year_fractions(
+        [value for _, value in cashflows],
+        year_fractions([dt for dt, _ in cashflows]),
+        guess=guess,
+    )
+
+
+def year_fractions(dates: Sequence[datetime]) -> list[float]:
+    """Actual/365 year fractions from the first date, shared by legs paid on the same grid."""
+
+    if not dates:
+        return []
+    start = dates[0]
+    return [(dt - start).days / 365.0 for dt in dates]
+
+
+XIRR_BISECTION_BRACKET = (-0.99, 10.0)
+XIRR_NPV_TOLERANCE = 1e-9
+
 
-    values = [value for _, value in cashflows]
-    has_positive = any(value > 0 for value in values)
-    has_negative = any(value < 0 for value in values)
-    if not (has_positive and has_negative):
+def xirr_from_year_fractions(values: Sequence[float], years: Sequence[float], guess: float = 0.1) -> Optional[float]:
+    if len(values) == 0:
         return None
 
-    start = cashflows[0][0]
+    amounts = np.asarray(values, dtype=np.float64)
+    if not ((amounts > 0).any() and (amounts < 0).any()):
+        return None
 
-    def npv(rate: float) -> float:
-        return sum(
-            value / (1.0 + rate) ** ((dt - start).days / 365.0)
-            for dt, value in cashflows
-        )
+    times = np.asarray(years, dtype=np.float64)
 
     rate = guess
-    for _ in range(100):
-        base = 1.0 + rate
-        if base <= 0:
-            return None
-        f_value = npv(rate)
-        if abs(f_value) < 1e-9:
-            return rate
-        derivative = 0.0
-        for dt, value in cashflows:
-            years = (dt - start).days / 365.0
-            derivative -= years * value / (base ** (years + 1.0))
-        if derivative == 0:
-            return None
-        rate -= f_value / derivative
-        if not isfinite(rate):
-            return None
-    return rate if isfinite(rate) else None
+    with np.errstate(divide="ignore", over="ignore", invalid="ignore"):
+        for _ in range(100):
+            if rate <= -1.0:
+                break
+            f_value, derivative = _npv_and_derivative(amounts, times, rate)
+            if not isfinite(f_value):
+                break
+            if abs(f_value) < XIRR_NPV_TOLERANCE:
+                return rate
+            # A flat NPV or a step past -100% would send Newton off the curve; bisect instead.
+            if not isfinite(derivative) or abs(derivative) < 1e-12:
+                break
+            next_rate = rate - f_value / derivative
+            if not isfinite(next_rate) or next_rate <= -1.0:
+                break
+            rate = next_rate
+        # Newton stalled, diverged or ran out of iterations; any iterate within tolerance already returned
+        # above, so the last one is not a root and the bracketed bisection decides.
+        return _xirr_bisection(amounts, times)
+
+
+def _npv_and_derivative(amounts: np.ndarray, times: np.ndarray, rate: float) -> tuple[float, float]:
+    base = 1.0 + rate
+    # One exp pass gives the present values; NPV and its derivative are then a sum and a dot product.
+    present_values = amounts * np.exp(-times * np.log(base))
+    return float(present_values.sum()), -float(times @ present_values) / base
+
+
+def _xirr_bisection(amounts: np.ndarray, times: np.ndarray) -> Optional[float]:
+    low, high = XIRR_BISECTION_BRACKET
+    f_low, _ = _npv_and_derivative(amounts, times, low)
+    f_high, _ = _npv_and_derivative(amounts, times, high)
+    if not (isfinite(f_low) and isfinite(f_high)) or (f_low < 0.0) == (f_high < 0.0):
+        return None
+    for _ in range(200):
+        middle = 0.5 * (low + high)
+        f_middle, _ = _npv_and_derivative(amounts, times, middle)
+        if abs(f_middle) < XIRR_NPV_TOLERANCE or high - low < 1e-12:
+            return middle
+        if (f_middle < 0.0) == (f_low < 0.0):
+            low, f_low = middle, f_middle
+        else:
+            high = middle
+    return 0.5 * (low + high)
 
 
 def calculate_duration_years(periods: Sequence[PeriodResult]) -> Optional[float]:
-    discounted_pmts = [period.vp_pmt_senior for period in periods[1:] if period.vp_pmt_senior]
-    if not discounted_pmts:
+    discounted = np.array([period.vp_pmt_senior or 0.0 for period in periods[1:]], dtype=np.float64)
+    paid = discounted != 0.0
+    if not paid.any():
         return None
 
-    total_discounted = sum(discounted_pmts)
+    discounted = discounted[paid]
+    total_discounted = float(np.sum(discounted))
     if total_discounted == 0:
         return None
 
-    weighted_days = sum(
-        period.vp_pmt_senior * period.du / total_discounted / 252.0
-        for period in periods[1:]
-        if period.vp_pmt_senior
-    )
-    return weighted_days
+    du = np.array([period.du for period in periods[1:]], dtype=np.float64)[paid]
+    return float(np.sum(discounted * du / total_discounted / 252.0))
 
 
 def lookup_pre_di_duration(periods: Sequence[PeriodResult], duration_years: Optional[float]) -> Optional[float]:
     if duration_years is None:
         return None
 
-    target_du = duration_years * 252.0
-    curve_points = [
-        (float(period.du), float(period.pre_di))
-        for period in periods
-        if period.pre_di is not None
-    ]
+    curve_points = [(period.du, period.pre_di) for period in periods if period.pre_di is not None]
     if not curve_points:
         return None
-    curve_points.sort(key=lambda item: item[0])
-    first_du, first_rate = curve_points[0]
-    if target_du <= first_du:
-        return first_rate
-    last_du, last_rate = curve_points[-1]
-    if target_du >= last_du:
-        return last_rate
-    for (left_du, left_rate), (right_du, right_rate) in zip(curve_points, curve_points[1:]):
-        if left_du <= target_du <= right_du:
-            if right_du == left_du:
-                return right_rate
-            weight = (target_du - left_du) / (right_du - left_du)
-            return left_rate + (right_rate - left_rate) * weight
-    return None
+    du, rates = np.array(curve_points, dtype=np.float64).T
+    order = np.argsort(du, kind="stable")
+    # np.interp clamps to the first/last vertex outside the curve, like the workbook lookup.
+    return float(np.interp(duration_years * 252.0, du[order], rates[order]))
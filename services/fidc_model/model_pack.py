@@ -0,0 +1,259 @@
+"""Formula pack extractor for the original Modelo FIDC workbook.
+
+The .xlsm is read as a plain OOXML ZIP: ``xl/workbook.xml`` gives sheet names
+and defined names, and each ``xl/worksheets/sheet*.xml`` is streamed with
+``iterparse`` so only cells carrying an ``<f>`` child are materialized.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from hashlib import sha256
+from io import BytesIO
+import json
+from pathlib import Path
+import posixpath
+import re
+from threading import Lock
+from typing import IO
+from xml.etree import ElementTree as ET
+from zipfile import BadZipFile, ZipFile
+
+from openpyxl.formula.translate import Translator
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+SPREADSHEET_NS = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+RELATIONSHIP_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+PACKAGE_RELATIONSHIP_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+WORKSHEET_RELATIONSHIP_TYPE = f"{RELATIONSHIP_NS}/worksheet"
+DEFAULT_MODEL_PACK_CACHE_DIR = Path(".cache/model-pack")
+DEFAULT_MAX_WORKERS = 4
+SERIALIZED_MODEL_PACK_CACHE_SIZE = 8
+
+_CELL_TAG = f"{{{SPREADSHEET_NS}}}c"
+_FORMULA_TAG = f"{{{SPREADSHEET_NS}}}f"
+_ROW_TAG = f"{{{SPREADSHEET_NS}}}row"
+_FORMULA_TAG_PROBE = re.compile(rb"<(?:[A-Za-z_][\w.-]*:)?f[\s/>]")
+_BROKEN_NAME_VALUE = re.compile(r"#(?:REF!|N/A|NAME\?|VALUE!)|\[\d+\]")
+_SHEET_RANGE_NAME_VALUE = re.compile(
+    r"^(?:'(?P<quoted>(?:[^']|'')+)'|(?P<plain>[^'!]+))!\$?[A-Z]{1,3}\$?\d+(?::\$?[A-Z]{1,3}\$?\d+)?$"
+)
+# In-process LRU of serialized packs keyed by workbook digest, so the workbook bytes themselves are not retained.
+_SERIALIZED_MODEL_PACKS: OrderedDict[str, bytes] = OrderedDict()
+_SERIALIZED_MODEL_PACKS_LOCK = Lock()
+
+
+class ModelPackError(RuntimeError):
+    """Raised when the workbook package cannot be read as an OOXML spreadsheet."""
+
+
+def extract_model_pack(
+    file_bytes: bytes,
+    *,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    columnar: bool = False,
+) -> dict[str, object]:
+    """Extract sheet names, defined names and formulas from an .xlsx/.xlsm package.
+
+    ``cells`` maps each sheet to ``[{"addr", "formula"}, ...]``; with ``columnar=True`` it maps to
+    parallel ``{"addrs": [...], "formulas": [...]}`` lists instead, skipping the per-cell dicts.
+    """
+
+    try:
+        archive = ZipFile(BytesIO(file_bytes))
+    except BadZipFile as exc:
+        raise ModelPackError("Arquivo não é um pacote .xlsx/.xlsm válido.") from exc
+
+    with archive:
+        sheets, named_ranges = _read_workbook_index(archive)
+        part_names = [part_name for _, part_name in sheets]
+        workers = min(max(1, int(max_workers or 1)), len(part_names))
+        if workers <= 1:
+            parsed = [_parse_sheet_part(archive, part_name) for part_name in part_names]
+        else:
+            # ZipFile serializes seeks on the shared handle, so sheets can inflate and parse concurrently.
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                parsed = list(executor.map(lambda part_name: _parse_sheet_part(archive, part_name), part_names))
+        cells: dict[str, object] = {}
+        for (title, _), (addrs, formulas) in zip(sheets, parsed):
+            if columnar:
+                cells[title] = {"addrs": addrs, "formulas": formulas}
+            else:
+                cells[title] = [{"addr": addr, "formula": formula} for addr, formula in zip(addrs, formulas)]
+
+    return {
+        "sheets": [title for title, _ in sheets],
+        "named_ranges": named_ranges,
+        "cells": cells,
+    }
+
+
+def extract_model_pack_json(
+    file_bytes: bytes,
+    *,
+    cache_dir: Path | None = DEFAULT_MODEL_PACK_CACHE_DIR,
+    digest: str | None = None,
+) -> bytes:
+    """Return the serialized model pack, reusing the parse for identical workbook bytes.
+
+    Callers that already hold the SHA-256 of ``file_bytes`` can pass it as ``digest`` to skip rehashing.
+    """
+
+    digest = digest or sha256(file_bytes).hexdigest()
+    if cache_dir is not None:
+        cached = _read_cached_model_pack(cache_dir, digest)
+        if cached is not None:
+            return cached
+    payload = _serialized_model_pack(digest, file_bytes)
+    if cache_dir is not None:
+        _write_cached_model_pack(cache_dir, digest, payload)
+    return payload
+
+
+def _serialized_model_pack(digest: str, file_bytes: bytes) -> bytes:
+    with _SERIALIZED_MODEL_PACKS_LOCK:
+        cached = _SERIALIZED_MODEL_PACKS.get(digest)
+        if cached is not None:
+            _SERIALIZED_MODEL_PACKS.move_to_end(digest)
+            return cached
+
+    model_pack = extract_model_pack(file_bytes)
+    if orjson is not None:
+        payload = orjson.dumps(model_pack, option=orjson.OPT_INDENT_2)
+    else:
+        payload = json.dumps(model_pack, ensure_ascii=False, indent=2).encode("utf-8")
+
+    with _SERIALIZED_MODEL_PACKS_LOCK:
+        _SERIALIZED_MODEL_PACKS[digest] = payload
+        _SERIALIZED_MODEL_PACKS.move_to_end(digest)
+        while len(_SERIALIZED_MODEL_PACKS) > SERIALIZED_MODEL_PACK_CACHE_SIZE:
+            _SERIALIZED_MODEL_PACKS.popitem(last=False)
+    return payload
+
+
+def _cache_path_for_digest(cache_dir: Path, digest: str) -> Path:
+    return Path(cache_dir) / f"{digest}.json"
+
+
+def _read_cached_model_pack(cache_dir: Path, digest: str) -> bytes | None:
+    path = _cache_path_for_digest(cache_dir, digest)
+    try:
+        if not path.is_file():
+            return None
+        return path.read_bytes()
+    except OSError:
+        return None
+
+
+def _write_cached_model_pack(cache_dir: Path, digest: str, payload: bytes) -> None:
+    try:
+        Path(cache_dir).mkdir(parents=True, exist_ok=True)
+        _cache_path_for_digest(cache_dir, digest).write_bytes(payload)
+    except OSError:
+        return
+
+
+def _read_workbook_index(archive: ZipFile) -> tuple[list[tuple[str, str]], list[dict[str, str]]]:
+    try:
+        workbook_root = ET.fromstring(archive.read("xl/workbook.xml"))
+        rels_root = ET.fromstring(archive.read("xl/_rels/workbook.xml.rels"))
+    except KeyError as exc:
+        raise ModelPackError("Pacote sem xl/workbook.xml ou relacionamentos do workbook.") from exc
+
+    targets = {
+        rel.get("Id"): _resolve_part_name(rel.get("Target", ""))
+        for rel in rels_root.iter(f"{{{PACKAGE_RELATIONSHIP_NS}}}Relationship")
+        if rel.get("Type") == WORKSHEET_RELATIONSHIP_TYPE
+    }
+    sheets: list[tuple[str, str]] = []
+    for sheet in workbook_root.iter(f"{{{SPREADSHEET_NS}}}sheet"):
+        part_name = targets.get(sheet.get(f"{{{RELATIONSHIP_NS}}}id"))
+        if part_name is None:
+            continue
+        sheets.append((sheet.get("name", ""), part_name))
+
+    sheet_titles = {title for title, _ in sheets}
+    named_ranges: list[dict[str, str]] = []
+    for defined_name in workbook_root.iter(f"{{{SPREADSHEET_NS}}}definedName"):
+        if not _is_workbook_range_name(defined_name, sheet_titles):
+            continue
+        entry = {"name": defined_name.get("name", ""), "value": defined_name.text or ""}
+        local_sheet_id = defined_name.get("localSheetId")
+        if local_sheet_id is not None and local_sheet_id.isdigit() and int(local_sheet_id) < len(sheets):
+            entry["sheet"] = sheets[int(local_sheet_id)][0]
+        named_ranges.append(entry)
+    return sheets, named_ranges
+
+
+def _is_workbook_range_name(defined_name: ET.Element, sheet_titles: set[str]) -> bool:
+    """Keep visible names that point at a range of one of this workbook's sheets.
+
+    Built-in ``_xlnm`` names, hidden add-in settings, ``#REF!``/``#N/A`` leftovers and external-link
+    references are dropped.
+    """
+
+    name = defined_name.get("name", "")
+    value = defined_name.text or ""
+    if name.startswith("_xlnm.") or defined_name.get("hidden") in {"1", "true"} or _BROKEN_NAME_VALUE.search(value):
+        return False
+    match = _SHEET_RANGE_NAME_VALUE.match(value)
+    if match is None:
+        return False
+    sheet = match.group("plain") or match.group("quoted").replace("''", "'")
+    return sheet in sheet_titles
+
+
+def _resolve_part_name(target: str) -> str:
+    if target.startswith("/"):
+        return target.lstrip("/")
+    return posixpath.normpath(posixpath.join("xl", target))
+
+
+def _parse_sheet_part(archive: ZipFile, part_name: str) -> tuple[list[str], list[str]]:
+    raw = archive.read(part_name)
+    # Data-only sheets (holidays, curves) carry no <f> element at all; skip the XML parse for them.
+    if _FORMULA_TAG_PROBE.search(raw) is None:
+        return [], []
+    return _parse_sheet_formulas(BytesIO(raw))
+
+
+def _parse_sheet_formulas(stream: IO[bytes]) -> tuple[list[str], list[str]]:
+    addrs: list[str] = []
+    formulas: list[str] = []
+    shared_masters: dict[str, tuple[str, str]] = {}
+    for _, elem in ET.iterparse(stream, events=("end",)):
+        if elem.tag == _CELL_TAG:
+            formula_elem = elem.find(_FORMULA_TAG)
+            if formula_elem is not None:
+                addr = elem.get("r", "")
+                formula = _cell_formula(addr, formula_elem, shared_masters)
+                if formula is not None:
+                    addrs.append(addr)
+                    formulas.append(formula)
+            elem.clear()
+        elif elem.tag == _ROW_TAG:
+            elem.clear()
+    return addrs, formulas
+
+
+def _cell_formula(addr: str, formula_elem: ET.Element, shared_masters: dict[str, tuple[str, str]]) -> str | None:
+    text = formula_elem.text or ""
+    if formula_elem.get("t") == "shared":
+        shared_index = formula_elem.get("si", "")
+        if text:
+            shared_masters[shared_index] = (addr, f"={text}")
+            return f"={text}"
+        master = shared_masters.get(shared_index)
+        if master is None:
+            return None
+        master_addr, master_formula = master
+        return Translator(master_formula, origin=master_addr).translate_formula(addr)
+    if not text:
+        return None
+    return f"={text}"
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from copy import copy
 import json
 import os
 from pathlib import Path
@@ -11,6 +12,7 @@ from datetime import date, datetime, timedelta
 from html import escape
 from io import BytesIO
 import tempfile
+from typing import Callable, Sequence
 from zipfile import ZIP_DEFLATED, ZipFile
 
 import altair as alt
@@ -37,6 +39,7 @@ from services.fidc_model import (
     PDD_METHOD_NPL90_STOCK,
     RATE_MODE_POST_CDI,
     RATE_MODE_PRE,
+    PeriodResult,
     Premissas,
     annual_252_to_monthly_rate,
     build_flow,
@@ -44,6 +47,7 @@ from services.fidc_model import (
     cession_discount_to_monthly_rate,
     monthly_to_annual_252_rate,
     monthly_rate_to_cession_discount,
+    period_results_columns,
 )
 from services.fidc_model.b3_curves import (
     B3CurveError,
@@ -132,6 +136,7 @@ DEFAULT_INICIO_RUNOFF_MESES = 18.0
 DEFAULT_WRITEOFF_ATRASO_MESES = 12.0
 DEFAULT_METODOLOGIA_PDD = PDD_METHOD_LINEAR_EXPECTED
 LOSS_SCENARIO_VALUES = (0.0, 0.20, 0.30, 0.40, 0.50)
+TIMELINE_PREVIEW_ROWS = 500
 MC3_PRESET_VERSION = "mc3-2026-06-22-pdd-linear-v1"
 DEFAULT_CURVE_START_YEAR = 2026
 DEFAULT_SELIC_PERPETUAL_YEAR = 2028
@@ -436,6 +441,29 @@ def _load_b3_calendar_snapshot(start_year: int, end_year: int) -> B3CalendarSnap
     return build_b3_calendar_snapshot(datas, html_text, content_hash=content_hash)
 
 
+@st.cache_data(show_spinner=False, max_entries=64)
+def _cached_build_flow(
+    source_key: tuple[object, ...],
+    datas: tuple[datetime, ...],
+    premissas: Premissas,
+    interpolation_method: str,
+    _feriados: tuple[date, ...],
+    _curva_du: tuple[float, ...],
+    _curva_taxa_aa: tuple[float, ...],
+) -> list[PeriodResult]:
+    # st.cache_data does not hash underscore-prefixed arguments; source_key identifies the calendar and curve.
+    return build_flow(datas, _feriados, _curva_du, _curva_taxa_aa, premissas, interpolation_method=interpolation_method)
+
+
+def _flow_source_key(selected_curve: _SelectedCurve, selected_calendar: _SelectedCalendar) -> tuple[object, ...]:
+    return (selected_curve.cache_key, selected_calendar.cache_key)
+
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def _timeline_csv_bytes(frame: pd.DataFrame) -> bytes:
+    return frame.to_csv(index=False).encode("utf-8")
+
+
 @st.cache_data(show_spinner=False, ttl=6 * 60 * 60)
 def _load_b3_curve_for_date(date_iso: str, curve_code: str) -> B3CurveSnapshot:
     return fetch_taxaswap_curve(date.fromisoformat(date_iso), curve_code=curve_code)
@@ -457,8 +485,8 @@ def _selected_curve_from_snapshot(inputs) -> _SelectedCurve:
         retrieved_label="curva local sem consulta externa",
         content_sha256="local-snapshot",
         point_count=len(inputs.curva_du),
-        first_du=int(inputs.curva_du[0]) if inputs.curva_du else None,
-        last_du=int(inputs.curva_du[-1]) if inputs.curva_du else None,
+        first_du=int(inputs.curva_du[0]) if len(inputs.curva_du) else None,
+        last_du=int(inputs.curva_du[-1]) if len(inputs.curva_du) else None,
         raw_line_count=None,
     )
 
@@ -1072,6 +1100,17 @@ def _scheduled_origination_components(
     return initial_portfolio, 0.0, 0.0, initial_portfolio
 
 
+# Flow fields read by _build_time_protection_frame; loss scenarios only materialize these columns.
+_TIME_PROTECTION_FIELDS = (
+    "indice",
+    "data",
+    "pl_sub_jr",
+    "fluxo_remanescente_mezz",
+    "nova_originacao",
+    "carteira_originada_acumulada",
+)
+
+
 def _build_time_protection_frame(
     frame: pd.DataFrame,
     *,
@@ -1118,13 +1157,9 @@ def _build_time_protection_frame(
     else:
         protection["residual_economico_fluxo"] = protection["pl_sub_jr"].diff().fillna(protection["pl_sub_jr"])
     protection["sub_disponivel"] = protection["pl_sub_jr"].clip(lower=0.0)
-    protection["perda_maxima_suportada"] = protection.apply(
-        lambda row: (
-            row["sub_disponivel"] / row["carteira_originada_acumulada"]
-            if row["indice"] > 0 and row["carteira_originada_acumulada"] > 0.0
-            else None
-        ),
-        axis=1,
+    carteira_originada = protection["carteira_originada_acumulada"].astype(float)
+    protection["perda_maxima_suportada"] = (protection["sub_disponivel"] / carteira_originada).where(
+        protection["indice"].gt(0) & carteira_originada.gt(0.0)
     )
     protection["serie"] = scenario_label
     protection["valor"] = protection["perda_maxima_suportada"]
@@ -1165,19 +1200,24 @@ def _build_loss_scenario_protection_frame(
     premissas: Premissas,
     interpolation_method: str,
     portfolio_mode: str,
+    source_key: tuple[object, ...] | None = None,
 ) -> pd.DataFrame:
+    feriados, curva_du, curva_taxa_aa = tuple(feriados), tuple(curva_du), tuple(curva_taxa_aa)
+    if source_key is None:
+        source_key = (feriados, curva_du, curva_taxa_aa)
     scenario_frames: list[pd.DataFrame] = []
     for loss_rate in LOSS_SCENARIO_VALUES:
         scenario_premissas = _premissas_for_loss_scenario(premissas, loss_rate)
-        scenario_results = build_flow(
-            datas,
+        scenario_results = _cached_build_flow(
+            source_key,
+            tuple(datas),
+            scenario_premissas,
+            interpolation_method,
             feriados,
             curva_du,
             curva_taxa_aa,
-            scenario_premissas,
-            interpolation_method=interpolation_method,
         )
-        scenario_frame = _build_dataframe(scenario_results)
+        scenario_frame = _build_dataframe(scenario_results, _TIME_PROTECTION_FIELDS)
         scenario_frames.append(
             _build_time_protection_frame(
                 scenario_frame,
@@ -1223,6 +1263,7 @@ def _build_pdd_method_loss_scenario_frames(
     premissas: Premissas,
     interpolation_method: str,
     portfolio_mode: str,
+    source_key: tuple[object, ...] | None = None,
 ) -> dict[str, pd.DataFrame]:
     return {
         label: _build_loss_scenario_protection_frame(
@@ -1233,6 +1274,7 @@ def _build_pdd_method_loss_scenario_frames(
             premissas=replace(premissas, metodologia_pdd=method),
             interpolation_method=interpolation_method,
             portfolio_mode=portfolio_mode,
+            source_key=source_key,
         )
         for label, method in PDD_METHOD_LABELS.items()
     }
@@ -1248,7 +1290,7 @@ def _text_number_input(
 ) -> str:
     return _text_input_with_session_default(
         label,
-        default_value=_format_input_value(default, decimals),
+        default_value=lambda: _format_input_value(default, decimals),
         key=key,
         help_text=help_text,
     )
@@ -1264,7 +1306,7 @@ def _text_brl_input(
 ) -> str:
     return _text_input_with_session_default(
         label,
-        default_value=_format_brl_input_value(default, decimals),
+        default_value=lambda: _format_brl_input_value(default, decimals),
         key=key,
         help_text=help_text,
     )
@@ -1280,7 +1322,7 @@ def _text_percent_input(
 ) -> str:
     return _text_input_with_session_default(
         label,
-        default_value=_format_percent_input_value(default, decimals),
+        default_value=lambda: _format_percent_input_value(default, decimals),
         key=key,
         help_text=help_text,
     )
@@ -1289,13 +1331,14 @@ def _text_percent_input(
 def _text_input_with_session_default(
     label: str,
     *,
-    default_value: str,
+    default_value: Callable[[], str],
     key: str,
     help_text: str | None,
 ) -> str:
     kwargs: dict[str, object] = {"key": key, "help": help_text}
     if key not in st.session_state:
-        kwargs["value"] = default_value
+        # Defaults are only formatted when the widget is first seeded, not on every rerun.
+        kwargs["value"] = default_value()
     return st.text_input(label, **kwargs)
 
 
@@ -1303,8 +1346,8 @@ def _session_widget_index(key: str, default_index: int = 0) -> int | None:
     return None if key in st.session_state else default_index
 
 
-def _build_dataframe(results) -> pd.DataFrame:
-    frame = pd.DataFrame([result.__dict__ for result in results])
+def _build_dataframe(results, columns: Sequence[str] | None = None) -> pd.DataFrame:
+    frame = pd.DataFrame(period_results_columns(results, columns))
     frame["data"] = pd.to_datetime(frame["data"])
     return frame
 
@@ -1820,10 +1863,12 @@ def _style_dataframe_sheet(worksheet, fonts: dict[str, object], fills: dict[str,
     worksheet.freeze_panes = "A2"
     worksheet.auto_filter.ref = worksheet.dimensions
     headers = [str(worksheet.cell(1, col).value or "") for col in range(1, worksheet.max_column + 1)]
+    header_alignment = Alignment(horizontal="center", vertical="center", wrap_text=True)
+    body_alignment = Alignment(vertical="top", wrap_text=True)
     for cell in worksheet[1]:
         cell.fill = fills["header"]
         cell.font = fonts["header"]
-        cell.alignment = Alignment(horizontal="center", vertical="center", wrap_text=True)
+        cell.alignment = header_alignment
         cell.border = border
     money_tokens = ("Carteira", "Fluxo", "PL", "Custos", "Perda", "Provisão", "NPL", "Principal", "Juros", "PMT", "Saldo", "Resultado", "Originação", "Caixa", "EAD", "Valor")
     pct_tokens = ("Taxa", "FRA", "Subordinação", "Cobertura", "Colchão", "Preço pago / face")
@@ -1832,18 +1877,28 @@ def _style_dataframe_sheet(worksheet, fonts: dict[str, object], fills: dict[str,
         non_empty_values = [value for value in values if value is not None]
         width = min(max(len(str(value)) for value in non_empty_values) + 2, 48) if non_empty_values else 10
         worksheet.column_dimensions[worksheet.cell(1, col_idx).column_letter].width = max(width, 10)
-        for row_idx in range(2, worksheet.max_row + 1):
-            cell = worksheet.cell(row_idx, col_idx)
+        if any(token in header for token in pct_tokens):
+            number_format = "0.00%"
+        elif any(token in header for token in money_tokens):
+            number_format = 'R$ #,##0'
+        else:
+            number_format = "#,##0.00"
+        # Styling a cell through the descriptors re-hashes every style object; resolve each distinct
+        # (starting style, numeric) combination once per column and copy the resulting style array.
+        resolved_styles: dict[tuple, object] = {}
+        for (cell,) in worksheet.iter_rows(min_row=2, min_col=col_idx, max_col=col_idx):
+            is_numeric = isinstance(cell.value, (int, float))
+            style_key = (is_numeric, tuple(cell._style or ()))
+            resolved = resolved_styles.get(style_key)
+            if resolved is not None:
+                cell._style = copy(resolved)
+                continue
             cell.font = fonts["body"]
             cell.border = border
-            cell.alignment = Alignment(vertical="top", wrap_text=True)
-            if isinstance(cell.value, (int, float)):
-                if any(token in header for token in pct_tokens):
-                    cell.number_format = "0.00%"
-                elif any(token in header for token in money_tokens):
-                    cell.number_format = 'R$ #,##0'
-                else:
-                    cell.number_format = "#,##0.00"
+            cell.alignment = body_alignment
+            if is_numeric:
+                cell.number_format = number_format
+            resolved_styles[style_key] = copy(cell._style)
 
 
 def _build_dashboard_sheet(
@@ -3689,7 +3744,7 @@ def _validate_model_inputs(inputs) -> list[str]:
 
 def _validate_snapshot_curve(inputs) -> list[str]:
     errors: list[str] = []
-    if not inputs.curva_du or not inputs.curva_cdi:
+    if len(inputs.curva_du) == 0 or len(inputs.curva_cdi) == 0:
         errors.append("curva DI/Pre ausente em model_data.json")
     if len(inputs.curva_du) != len(inputs.curva_cdi):
         errors.append("curva_du e curva_cdi têm tamanhos diferentes")
@@ -3911,22 +3966,18 @@ def _build_balance_area_frame(frame: pd.DataFrame) -> pd.DataFrame:
     return long_df
 
 
-def _available_subordination_pct(row: pd.Series) -> float | None:
-    pl_fidc = row.get("pl_fidc")
-    pl_sub_jr = row.get("pl_sub_jr")
-    if pd.isna(pl_fidc) or pd.isna(pl_sub_jr) or pl_fidc <= 0:
-        return None
-    return max(float(pl_sub_jr), 0.0) / float(pl_fidc)
+def _available_subordination_pct(frame: pd.DataFrame) -> pd.Series:
+    pl_fidc = frame["pl_fidc"].astype(float)
+    pl_sub_jr = frame["pl_sub_jr"].astype(float)
+    return (pl_sub_jr.clip(lower=0.0) / pl_fidc).where(pl_fidc.gt(0.0) & pl_sub_jr.notna())
 
 
 def _build_loss_area_frame(frame: pd.DataFrame) -> pd.DataFrame:
     loss_column = "perda_carteira_despesa" if "perda_carteira_despesa" in frame.columns else "inadimplencia_despesa"
     chart_frame = frame[["indice", "data", "carteira", loss_column]].copy()
     chart_frame = chart_frame.rename(columns={loss_column: "perda_carteira_despesa"})
-    chart_frame["perda_periodo_pct"] = chart_frame.apply(
-        lambda row: row["perda_carteira_despesa"] / row["carteira"] if row["carteira"] else None,
-        axis=1,
-    )
+    carteira = chart_frame["carteira"].astype(float)
+    chart_frame["perda_periodo_pct"] = (chart_frame["perda_carteira_despesa"] / carteira).where(carteira.ne(0.0))
     long_df = chart_frame.dropna(subset=["perda_periodo_pct"]).copy()
     long_df["serie"] = "Perda do período"
     long_df["valor"] = long_df["perda_periodo_pct"]
@@ -3959,7 +4010,7 @@ def _build_protection_area_frame(
     protection_frame: pd.DataFrame | None = None,
 ) -> pd.DataFrame:
     chart_frame = frame[["indice", "data", "pl_fidc", "pl_sub_jr"]].copy()
-    chart_frame["subordinacao_display"] = chart_frame.apply(_available_subordination_pct, axis=1)
+    chart_frame["subordinacao_display"] = _available_subordination_pct(chart_frame)
     chart_frame["numerador_formatado"] = chart_frame["pl_sub_jr"].clip(lower=0.0).map(_format_brl)
     chart_frame["denominador_formatado"] = chart_frame["pl_fidc"].map(_format_brl)
     long_df = chart_frame.melt(
@@ -4307,6 +4358,68 @@ def _revolvency_cards_data(metrics: _RevolvencyMetrics) -> list[dict[str, str]]:
     ]
 
 
+@st.fragment
+def _render_committee_timeline(committee_timeline_frame: pd.DataFrame) -> None:
+    timeline_view = committee_timeline_frame
+    if len(committee_timeline_frame) > TIMELINE_PREVIEW_ROWS and not st.checkbox(
+        "Mostrar todas as linhas",
+        key="modelo_fidc_timeline_all_rows",
+        help=f"Por padrão a tabela exibe os primeiros {TIMELINE_PREVIEW_ROWS} períodos; o CSV e o Excel trazem a timeline completa.",
+    ):
+        timeline_view = committee_timeline_frame.head(TIMELINE_PREVIEW_ROWS)
+    st.dataframe(timeline_view, width="stretch", hide_index=True)
+
+
+@st.fragment
+def _render_model_exports(
+    *,
+    export_signature: tuple,
+    csv_bytes: bytes,
+    pptx_bytes: bytes | None,
+    pptx_error: Exception | None,
+    build_excel_bytes: Callable[[], bytes],
+) -> None:
+    with st.expander("Dados e exportações", expanded=False):
+        if pptx_bytes is not None:
+            st.download_button(
+                "Exportar deck de comitê (PPTX)",
+                data=pptx_bytes,
+                file_name="modelo_fidc_dashboard.pptx",
+                mime="application/vnd.openxmlformats-officedocument.presentationml.presentation",
+                width="stretch",
+            )
+        else:
+            st.warning("O PPTX não pôde ser preparado neste ambiente; Excel e CSV permanecem disponíveis.")
+            if diagnostics_enabled() and pptx_error is not None:
+                st.caption(f"{type(pptx_error).__name__}: {pptx_error}")
+        st.download_button(
+            "Baixar timeline CSV",
+            data=csv_bytes,
+            file_name="modelo_fidc_timeline.csv",
+            mime="text/csv",
+            width="stretch",
+        )
+        excel_payload = st.session_state.get("modelo_fidc_excel_payload")
+        excel_bytes = excel_payload[1] if excel_payload and excel_payload[0] == export_signature else None
+        if excel_bytes is None and st.button(
+            "Preparar dashboard Excel",
+            key="modelo_fidc_prepare_excel",
+            width="stretch",
+            help="Monta o Excel com gráficos somente sob demanda para não refazer a exportação a cada interação.",
+        ):
+            with st.spinner("Montando dashboard Excel..."):
+                excel_bytes = build_excel_bytes()
+            st.session_state["modelo_fidc_excel_payload"] = (export_signature, excel_bytes)
+        if excel_bytes is not None:
+            st.download_button(
+                "Baixar dashboard Excel",
+                data=excel_bytes,
+                file_name="modelo_fidc_dashboard.xlsx",
+                mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+                width="stretch",
+            )
+
+
 def render_tab_modelo_fidc(*, embedded: bool = False) -> None:
     inputs = _load_inputs("model_data.json")
 
@@ -5261,6 +5374,7 @@ def render_tab_modelo_fidc(*, embedded: bool = False) -> None:
             "programado da SUB; por isso, o waterfall mantém a SUB como residual."
         )
 
+    flow_source_key = _flow_source_key(selected_curve, selected_calendar)
     simulation_signature = (
         selected_curve.cache_key,
         selected_calendar.cache_key,
@@ -5276,13 +5390,14 @@ def render_tab_modelo_fidc(*, embedded: bool = False) -> None:
         results = st.session_state["modelo_fidc_periods"]
         kpis = st.session_state["modelo_fidc_kpis"]
     else:
-        results = build_flow(
-            simulation_dates,
+        results = _cached_build_flow(
+            flow_source_key,
+            tuple(simulation_dates),
+            premissas,
+            interpolation_method,
             selected_calendar.feriados,
             selected_curve.curva_du,
             selected_curve.curva_taxa_aa,
-            premissas,
-            interpolation_method=interpolation_method,
         )
         kpis = build_kpis(results)
         st.session_state["modelo_fidc_signature"] = simulation_signature
@@ -5293,13 +5408,14 @@ def render_tab_modelo_fidc(*, embedded: bool = False) -> None:
         st.info("Sem datas suficientes para montar o fluxo.")
         return
 
-    zero_default_results = build_flow(
-        simulation_dates,
+    zero_default_results = _cached_build_flow(
+        flow_source_key,
+        tuple(simulation_dates),
+        _premissas_sem_perdas(premissas),
+        interpolation_method,
         selected_calendar.feriados,
         selected_curve.curva_du,
         selected_curve.curva_taxa_aa,
-        _premissas_sem_perdas(premissas),
-        interpolation_method=interpolation_method,
     )
     revolvency_metrics = _build_revolvency_metrics(
         premissas=premissas,
@@ -5308,19 +5424,6 @@ def render_tab_modelo_fidc(*, embedded: bool = False) -> None:
     )
 
     frame = _build_dataframe(results)
-    zero_default_frame = _build_dataframe(zero_default_results)
-    protection_frame = _build_time_protection_frame(
-        frame,
-        premissas=premissas,
-        portfolio_mode=portfolio_mode_label,
-        scenario_label="Cenário com perdas",
-    )
-    zero_protection_frame = _build_time_protection_frame(
-        zero_default_frame,
-        premissas=premissas,
-        portfolio_mode=portfolio_mode_label,
-        scenario_label="Cenário sem perdas",
-    )
     scenario_protection_chart_df = _build_loss_scenario_protection_frame(
         datas=simulation_dates,
         feriados=selected_calendar.feriados,
@@ -5329,6 +5432,7 @@ def render_tab_modelo_fidc(*, embedded: bool = False) -> None:
         premissas=premissas,
         interpolation_method=interpolation_method,
         portfolio_mode=portfolio_mode_label,
+        source_key=flow_source_key,
     )
     pdd_method_protection_frames = _build_pdd_method_loss_scenario_frames(
         datas=simulation_dates,
@@ -5338,8 +5442,8 @@ def render_tab_modelo_fidc(*, embedded: bool = False) -> None:
         premissas=premissas,
         interpolation_method=interpolation_method,
         portfolio_mode=portfolio_mode_label,
+        source_key=flow_source_key,
     )
-    protection_chart_frame = pd.concat([protection_frame, zero_protection_frame], ignore_index=True)
     export_frame = _build_export_dataframe(frame)
     display_frame = _build_display_dataframe(export_frame)
     committee_timeline_frame = _build_committee_timeline_dataframe(display_frame)
@@ -5550,9 +5654,9 @@ def render_tab_modelo_fidc(*, embedded: bool = False) -> None:
         st.dataframe(memory_df, width="stretch", hide_index=True)
 
     st.markdown('<div class="fidc-model-section-title">Timeline de comitê</div>', unsafe_allow_html=True)
-    st.dataframe(committee_timeline_frame, width="stretch", hide_index=True)
+    _render_committee_timeline(committee_timeline_frame)
 
-    csv = export_frame.to_csv(index=False).encode("utf-8")
+    csv = _timeline_csv_bytes(export_frame)
     premissas_summary_df = _build_premissas_summary_dataframe(
         premissas=premissas,
         taxa_cessao_input_mode=taxa_cessao_input_mode,
@@ -5576,19 +5680,6 @@ def render_tab_modelo_fidc(*, embedded: bool = False) -> None:
     )
     kpi_cards = _model_kpi_cards_data(kpis, results, has_mezz=proporcao_mezz > 0.000001)
     revolvency_cards = _revolvency_cards_data(revolvency_metrics)
-    excel_bytes = _build_model_dashboard_excel_bytes(
-        export_frame=export_frame,
-        kpi_cards=kpi_cards,
-        revolvency_cards=revolvency_cards,
-        premissas_summary_df=premissas_summary_df,
-        memory_df=memory_df,
-        curve_source_df=_build_curve_source_dataframe(selected_curve, selected_calendar, interpolation_label),
-        revolvency_export_df=_build_revolvency_export_dataframe(revolvency_metrics),
-        protection_export_df=_build_time_protection_export_dataframe(scenario_protection_chart_df),
-        balance_chart_df=balance_chart_df,
-        loss_chart_df=loss_chart_df,
-        protection_chart_df=protection_display_chart_df,
-    )
     pptx_bytes: bytes | None = None
     pptx_error: Exception | None = None
     try:
@@ -5603,33 +5694,28 @@ def render_tab_modelo_fidc(*, embedded: bool = False) -> None:
         )
     except Exception as exc:  # noqa: BLE001
         pptx_error = exc
-    with st.expander("Dados e exportações", expanded=False):
-        if pptx_bytes is not None:
-            st.download_button(
-                "Exportar deck de comitê (PPTX)",
-                data=pptx_bytes,
-                file_name="modelo_fidc_dashboard.pptx",
-                mime="application/vnd.openxmlformats-officedocument.presentationml.presentation",
-                width="stretch",
-            )
-        else:
-            st.warning("O PPTX não pôde ser preparado neste ambiente; Excel e CSV permanecem disponíveis.")
-            if diagnostics_enabled() and pptx_error is not None:
-                st.caption(f"{type(pptx_error).__name__}: {pptx_error}")
-        st.download_button(
-            "Baixar timeline CSV",
-            data=csv,
-            file_name="modelo_fidc_timeline.csv",
-            mime="text/csv",
-            width="stretch",
-        )
-        st.download_button(
-            "Baixar dashboard Excel",
-            data=excel_bytes,
-            file_name="modelo_fidc_dashboard.xlsx",
-            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-            width="stretch",
-        )
+    # The premissas summary also reflects display-only inputs (labels, cession-rate views, SELIC by year)
+    # that the simulation signature leaves out, so its rows are part of the Excel payload key.
+    export_signature = (simulation_signature, tuple(premissas_summary_df.itertuples(index=False, name=None)))
+    _render_model_exports(
+        export_signature=export_signature,
+        csv_bytes=csv,
+        pptx_bytes=pptx_bytes,
+        pptx_error=pptx_error,
+        build_excel_bytes=lambda: _build_model_dashboard_excel_bytes(
+            export_frame=export_frame,
+            kpi_cards=kpi_cards,
+            revolvency_cards=revolvency_cards,
+            premissas_summary_df=premissas_summary_df,
+            memory_df=memory_df,
+            curve_source_df=_build_curve_source_dataframe(selected_curve, selected_calendar, interpolation_label),
+            revolvency_export_df=_build_revolvency_export_dataframe(revolvency_metrics),
+            protection_export_df=_build_time_protection_export_dataframe(scenario_protection_chart_df),
+            balance_chart_df=balance_chart_df,
+            loss_chart_df=loss_chart_df,
+            protection_chart_df=protection_display_chart_df,
+        ),
+    )
 
     with st.expander("Sobre a base", expanded=False):
         st.markdown("**Fontes de juros**")
@@ -8,6 +8,7 @@ from services.fidc_model.calendar import (
     b3_market_holidays_for_dates,
     b3_market_holidays_for_year,
     build_day_counts,
+    holiday_array,
     merge_with_b3_market_holidays,
     networkdays,
     parse_b3_trading_calendar_holidays,
@@ -90,6 +91,39 @@ class B3CalendarTest(unittest.TestCase):
         self.assertEqual([0, 2], du)
         self.assertEqual(3, networkdays(date(2026, 4, 1), date(2026, 4, 6), [date(2026, 4, 3)]))
 
+    def test_networkdays_is_inclusive_and_order_independent(self):
+        holidays = [datetime(2026, 4, 3), date(2026, 4, 4), date(2026, 4, 3)]
+
+        self.assertEqual(1, networkdays(date(2026, 4, 6), date(2026, 4, 6), holidays))
+        self.assertEqual(0, networkdays(date(2026, 4, 4), date(2026, 4, 5), holidays))
+        self.assertEqual(
+            networkdays(date(2026, 3, 30), date(2026, 4, 10), holidays),
+            networkdays(date(2026, 4, 10), date(2026, 3, 30), holidays),
+        )
+
+    def test_networkdays_accepts_prebuilt_holiday_array(self):
+        holidays = [date(2026, 4, 3), date(2026, 4, 21), date(2026, 4, 3)]
+        prebuilt = holiday_array(holidays)
+
+        self.assertEqual(["2026-04-03", "2026-04-21"], [str(day) for day in prebuilt])
+        self.assertEqual(
+            networkdays(date(2026, 3, 30), date(2026, 4, 30), holidays),
+            networkdays(date(2026, 3, 30), date(2026, 4, 30), prebuilt),
+        )
+
+    def test_build_day_counts_matches_networkdays_per_date(self):
+        datas = [datetime(2026, 3, 2), datetime(2026, 4, 2), datetime(2026, 9, 2), datetime(2027, 3, 2)]
+        holidays = sorted(b3_market_holidays_for_dates(datas))
+
+        dc, du = build_day_counts(datas, holidays)
+
+        self.assertEqual([(dt - datas[0]).days for dt in datas], dc)
+        self.assertEqual(
+            [0] + [networkdays(datas[0].date(), dt.date(), holidays) - 1 for dt in datas[1:]],
+            du,
+        )
+        self.assertTrue(all(type(value) is int for value in dc + du))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -2,11 +2,17 @@ from __future__ import annotations
 
 import unittest
 
+import numpy as np
+
 from services.fidc_model.curves import (
     INTERPOLATION_METHOD_FLAT_FORWARD_252,
     INTERPOLATION_METHOD_SPLINE,
+    cubic_spline,
     flat_forward_252,
+    flat_forward_252_points,
     interpolate_curve,
+    interpolate_curve_points,
+    prepare_spline,
 )
 
 
@@ -41,6 +47,54 @@ class CurveInterpolationTest(unittest.TestCase):
         with self.assertRaisesRegex(ValueError, "Metodologia"):
             interpolate_curve(12.0, [1.0, 10.0], [0.10, 0.12], method="linear")
 
+    def test_interpolate_curve_points_matches_scalar_interpolation(self):
+        xs = [1.0, 10.0, 20.0, 42.0]
+        ys = [0.10, 0.12, 0.13, 0.125]
+        points = [0.0, 1.0, 5.5, 10.0, 19.0, 42.0, 60.0]
+
+        for method in (INTERPOLATION_METHOD_SPLINE, INTERPOLATION_METHOD_FLAT_FORWARD_252):
+            with self.subTest(method=method):
+                batch = interpolate_curve_points(points, xs, ys, method=method)
+                for point, value in zip(points, batch):
+                    self.assertAlmostEqual(interpolate_curve(point, xs, ys, method=method), value, delta=1e-15)
+
+        degenerate_cases = [
+            ([5.0, 5.0, 5.0], [0.10, 0.20, 0.30], [3.0, 5.0, 8.0]),
+            ([1.0, 10.0, 10.0], [0.10, 0.12, 0.14], [1.0, 10.0, 12.0]),
+        ]
+        for vertices, rates, degenerate_points in degenerate_cases:
+            with self.subTest(vertices=vertices):
+                batch = flat_forward_252_points(degenerate_points, vertices, rates)
+                for point, value in zip(degenerate_points, batch):
+                    self.assertAlmostEqual(flat_forward_252(point, vertices, rates), value, delta=1e-15)
+
+        with self.assertRaises(OverflowError):
+            flat_forward_252(300.0, [252.0, 504.0], [0.10, 1e300])
+        with self.assertRaises(OverflowError):
+            flat_forward_252_points([300.0], [252.0, 504.0], [0.10, 1e300])
+
+    def test_flat_forward_points_keep_scalar_edge_rules(self):
+        xs = [1.0, 1.0, 3.0]
+        ys = [0.10, 0.20, 0.30]
+
+        self.assertEqual([0.10, 0.10], flat_forward_252_points([0.0, 1.0], xs, ys).tolist())
+        with self.assertRaisesRegex(ValueError, "-100%"):
+            flat_forward_252_points([2.0], [1.0, 3.0], [-1.0, 0.20])
+
+    def test_prepared_spline_is_shared_for_equal_vertices(self):
+        spline = prepare_spline([1.0, 10.0, 20.0], [0.10, 0.12, 0.13])
+
+        self.assertIs(spline, prepare_spline(np.array([1, 10, 20]), (0.10, 0.12, 0.13)))
+        self.assertFalse(spline.b.flags.writeable)
+
+    def test_spline_extrapolates_linearly_outside_vertices(self):
+        xs = [1.0, 10.0, 20.0]
+        ys = [0.10, 0.12, 0.13]
+
+        left_slope = cubic_spline(1.0, xs, ys) - cubic_spline(0.0, xs, ys)
+        self.assertAlmostEqual(left_slope, cubic_spline(0.0, xs, ys) - cubic_spline(-1.0, xs, ys), delta=1e-15)
+        self.assertEqual(0.13, cubic_spline(20.0, xs, ys))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
 import json
+import pickle
 import unittest
 from datetime import datetime
 from pathlib import Path
 from types import SimpleNamespace
 
+import numpy as np
+
 from data_loader import load_model_inputs
 from services.fidc_model import (
     AMORTIZATION_MODE_BULLET,
@@ -17,6 +20,7 @@ from services.fidc_model import (
     INTEREST_PAYMENT_MODE_AFTER_GRACE,
     INTEREST_PAYMENT_MODE_PERIODIC,
     PDD_METHOD_LINEAR_EXPECTED,
+    PERIOD_RESULT_FIELDS,
     RATE_MODE_POST_CDI,
     RATE_MODE_PRE,
     Premissas,
@@ -26,9 +30,16 @@ from services.fidc_model import (
     cession_discount_to_monthly_rate,
     monthly_to_annual_252_rate,
     monthly_rate_to_cession_discount,
+    period_results_columns,
+)
+from services.fidc_model.engine import _admin_cost_period_amount, _class_annual_rate, _forward_rate_curve
+from services.fidc_model.metrics import (
+    calculate_duration_years,
+    lookup_pre_di_duration,
+    xirr,
+    xirr_from_year_fractions,
+    year_fractions,
 )
-from services.fidc_model.engine import _admin_cost_period_amount, _class_annual_rate
-from services.fidc_model.metrics import lookup_pre_di_duration
 
 
 FIXTURE_PATH = Path(__file__).resolve().parent / "fixtures" / "modelo_publico_fixture.json"
@@ -85,6 +96,25 @@ class FidcModelParityTest(unittest.TestCase):
         self.assertEqual(first.pl_sub_jr, 50000.0)
         self.assertIsNone(first.pl_sub_jr_modelo)
 
+    def test_period_results_columns_follow_field_order(self):
+        columns = period_results_columns(self.periods)
+
+        self.assertEqual(list(PERIOD_RESULT_FIELDS), list(columns))
+        self.assertEqual([period.pl_senior for period in self.periods], columns["pl_senior"])
+        self.assertEqual([], period_results_columns([])["data"])
+
+    def test_period_results_use_slots_and_survive_pickling(self):
+        # st.cache_data pickles the flow, so the slotted frozen dataclass must round-trip.
+        self.assertFalse(hasattr(self.periods[1], "__dict__"))
+        self.assertEqual(self.periods, pickle.loads(pickle.dumps(self.periods)))
+
+    def test_period_results_columns_can_select_fields(self):
+        columns = period_results_columns(self.periods, ("pl_sub_jr", "data"))
+
+        self.assertEqual(["pl_sub_jr", "data"], list(columns))
+        self.assertEqual([period.data for period in self.periods], columns["data"])
+        self.assertEqual({"data": []}, period_results_columns([], ("data",)))
+
     def test_periods_match_fluxo_base_fixture(self):
         comparable_fields = [
             "indice",
@@ -153,6 +183,18 @@ class FidcModelParityTest(unittest.TestCase):
     def test_prefixed_quota_rate_helper_uses_informed_annual_rate(self):
         self.assertAlmostEqual(0.12, _class_annual_rate(0.1490, 0.12, RATE_MODE_PRE), delta=1e-12)
 
+    def test_forward_rate_curve_chains_spot_rates_and_keeps_spot_without_new_du(self):
+        rates = np.array([np.nan, 0.15, 0.16, 0.16, 0.17])
+        du = np.array([0.0, 21.0, 63.0, 63.0, 126.0])
+
+        forwards = _forward_rate_curve(rates, du)
+
+        self.assertEqual(0.15, forwards[1])
+        expected = ((1.17 ** (126.0 / 252.0)) / (1.16 ** (63.0 / 252.0))) ** (252.0 / 63.0) - 1.0
+        self.assertAlmostEqual(expected, forwards[4], delta=1e-15)
+        self.assertEqual(0.16, forwards[3])
+        self.assertAlmostEqual(((1.16 ** (63.0 / 252.0)) / (1.15 ** (21.0 / 252.0))) ** (252.0 / 42.0) - 1.0, forwards[2])
+
     def test_pre_di_duration_is_interpolated_by_target_du(self):
         periods = [
             SimpleNamespace(du=126, pre_di=0.12),
@@ -160,6 +202,56 @@ class FidcModelParityTest(unittest.TestCase):
         ]
 
         self.assertAlmostEqual(0.13, lookup_pre_di_duration(periods, 0.75))
+        self.assertEqual(0.12, lookup_pre_di_duration(periods, 0.1))
+        self.assertEqual(0.14, lookup_pre_di_duration(periods, 3.0))
+
+    def test_senior_duration_weights_du_by_discounted_payments(self):
+        periods = [
+            SimpleNamespace(du=0, vp_pmt_senior=-1000.0),
+            SimpleNamespace(du=126, vp_pmt_senior=300.0),
+            SimpleNamespace(du=189, vp_pmt_senior=0.0),
+            SimpleNamespace(du=252, vp_pmt_senior=700.0),
+        ]
+
+        self.assertAlmostEqual((0.3 * 126 + 0.7 * 252) / 252.0, calculate_duration_years(periods), delta=1e-15)
+        self.assertIsNone(calculate_duration_years(periods[:1] + [SimpleNamespace(du=126, vp_pmt_senior=0.0)]))
+
+    def test_xirr_legs_share_year_fractions_of_the_payment_grid(self):
+        dates = [datetime(2025, 1, 1), datetime(2025, 7, 1), datetime(2026, 1, 1)]
+        values = [-1000.0, 50.0, 1050.0]
+
+        years = year_fractions(dates)
+        rate = xirr_from_year_fractions(values, years)
+
+        self.assertEqual([0.0, 181 / 365.0, 1.0], years)
+        self.assertEqual(xirr(list(zip(dates, values))), rate)
+        self.assertAlmostEqual(0.0, sum(value / (1.0 + rate) ** year for year, value in zip(years, values)), delta=1e-6)
+        self.assertIsNone(xirr_from_year_fractions([0.0, 10.0, 20.0], years))
+
+    def test_xirr_accepts_array_inputs_and_returns_plain_float(self):
+        rate = xirr_from_year_fractions(np.array([-1000.0, 1100.0]), np.array([0.0, 1.0]))
+
+        self.assertIs(type(rate), float)
+        self.assertAlmostEqual(0.10, rate, delta=1e-12)
+        self.assertIsNone(xirr_from_year_fractions(np.array([]), np.array([])))
+
+    def test_xirr_bisects_when_newton_steps_past_minus_one(self):
+        # From a 500% guess the first Newton step lands below -100%; the bracketed bisection still finds 10%.
+        rate = xirr_from_year_fractions([-100.0, 110.0], [0.0, 1.0], guess=5.0)
+
+        self.assertIs(type(rate), float)
+        self.assertAlmostEqual(0.10, rate, delta=1e-9)
+        self.assertIsNone(xirr_from_year_fractions([-100.0, 1e9], [0.0, 1.0], guess=1e12))
+
+    def test_xirr_bisects_when_newton_exhausts_iterations(self):
+        # Newton oscillates around 40% for 100 iterations here; the last iterate leaves NPV near 56.
+        values = [455.0, -787.0, -240.0, 479.0, 571.0, -202.0]
+        years = [0.0, 1.0, 2.0, 3.0, 4.0, 5.0]
+
+        rate = xirr_from_year_fractions(values, years)
+
+        self.assertIsNotNone(rate)
+        self.assertAlmostEqual(0.0, sum(value / (1.0 + rate) ** year for year, value in zip(years, values)), delta=1e-6)
 
     def test_prefixed_quota_rate_uses_informed_annual_rate(self):
         premissas = _build_default_premissas()
@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import json
+import tempfile
+import unittest
+from hashlib import sha256
+from io import BytesIO
+from pathlib import Path
+from zipfile import ZipFile
+
+from services.fidc_model.model_pack import (
+    _FORMULA_TAG_PROBE,
+    _SERIALIZED_MODEL_PACKS,
+    ModelPackError,
+    extract_model_pack,
+    extract_model_pack_json,
+)
+
+
+_WORKBOOK_XML = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+ xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">
+<sheets>
+<sheet name="Fluxo Base" sheetId="1" r:id="rId1"/>
+<sheet name="Holidays" sheetId="2" r:id="rId2"/>
+</sheets>
+<definedNames>
+<definedName name="Feriados">Holidays!$A$2:$A$10</definedName>
+<definedName name="Taxa" localSheetId="0">'Fluxo Base'!$C$6</definedName>
+<definedName name="_xlnm.Print_Area" localSheetId="0">'Fluxo Base'!$A$1:$AW$85</definedName>
+<definedName name="Quebrado">#REF!$C$6</definedName>
+<definedName name="Externo">[1]Plan1!$A$1</definedName>
+<definedName name="IQ_FY" hidden="1">1000</definedName>
+<definedName name="RiskNumIterations">1000</definedName>
+<definedName name="OutraPlanilha">Plan1!$A$1</definedName>
+</definedNames>
+</workbook>"""
+
+_WORKBOOK_RELS = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">
+<Relationship Id="rId2" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" Target="worksheets/sheet2.xml"/>
+<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" Target="/xl/worksheets/sheet1.xml"/>
+<Relationship Id="rId3" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" Target="styles.xml"/>
+</Relationships>"""
+
+_FLUXO_SHEET = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"><sheetData>
+<row r="4"><c r="F4"><v>45000</v></c><c r="G4"><f t="shared" ref="G4:G6" si="0">F4-$F$4</f><v>0</v></c></row>
+<row r="5"><c r="F5"><v>45180</v></c><c r="G5"><f t="shared" si="0"/><v>180</v></c></row>
+<row r="6"><c r="G6"><f t="shared" si="0"/><v>360</v></c><c r="H6"><f>NETWORKDAYS($F$4,F6,Feriados)-1</f><v>250</v></c></row>
+<row r="27"><c r="C27"><f t="array" ref="C27">SUMPRODUCT($Z$5:$Z$85,$H$5:$H$85)</f><v>1</v></c></row>
+</sheetData></worksheet>"""
+
+_HOLIDAYS_SHEET = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"><sheetData>
+<row r="2"><c r="A2"><v>45292</v></c></row>
+</sheetData></worksheet>"""
+
+
+def _workbook_bytes() -> bytes:
+    buffer = BytesIO()
+    with ZipFile(buffer, "w") as archive:
+        archive.writestr("xl/workbook.xml", _WORKBOOK_XML)
+        archive.writestr("xl/_rels/workbook.xml.rels", _WORKBOOK_RELS)
+        archive.writestr("xl/worksheets/sheet1.xml", _FLUXO_SHEET)
+        archive.writestr("xl/worksheets/sheet2.xml", _HOLIDAYS_SHEET)
+    return buffer.getvalue()
+
+
+class ModelPackTest(unittest.TestCase):
+    def test_extracts_formulas_in_workbook_sheet_order(self):
+        model_pack = extract_model_pack(_workbook_bytes())
+
+        self.assertEqual(["Fluxo Base", "Holidays"], model_pack["sheets"])
+        self.assertEqual([], model_pack["cells"]["Holidays"])
+        self.assertEqual(
+            [
+                {"addr": "G4", "formula": "=F4-$F$4"},
+                {"addr": "G5", "formula": "=F5-$F$4"},
+                {"addr": "G6", "formula": "=F6-$F$4"},
+                {"addr": "H6", "formula": "=NETWORKDAYS($F$4,F6,Feriados)-1"},
+                {"addr": "C27", "formula": "=SUMPRODUCT($Z$5:$Z$85,$H$5:$H$85)"},
+            ],
+            model_pack["cells"]["Fluxo Base"],
+        )
+
+    def test_columnar_layout_keeps_parallel_address_and_formula_lists(self):
+        model_pack = extract_model_pack(_workbook_bytes(), columnar=True)
+
+        self.assertEqual({"addrs": [], "formulas": []}, model_pack["cells"]["Holidays"])
+        fluxo = model_pack["cells"]["Fluxo Base"]
+        self.assertEqual(["G4", "G5", "G6", "H6", "C27"], fluxo["addrs"])
+        self.assertEqual("=F6-$F$4", fluxo["formulas"][2])
+
+    def test_parallel_sheet_parsing_matches_sequential_order(self):
+        workbook = _workbook_bytes()
+
+        self.assertEqual(extract_model_pack(workbook, max_workers=1), extract_model_pack(workbook, max_workers=4))
+
+    def test_reads_only_defined_names_that_point_at_workbook_ranges(self):
+        model_pack = extract_model_pack(_workbook_bytes())
+
+        self.assertEqual(
+            [
+                {"name": "Feriados", "value": "Holidays!$A$2:$A$10"},
+                {"name": "Taxa", "value": "'Fluxo Base'!$C$6", "sheet": "Fluxo Base"},
+            ],
+            model_pack["named_ranges"],
+        )
+
+    def test_formula_probe_matches_prefixed_tags_only(self):
+        self.assertIsNotNone(_FORMULA_TAG_PROBE.search(b'<x:f t="shared" si="0"/>'))
+        self.assertIsNotNone(_FORMULA_TAG_PROBE.search(b"<f>SUM(A1:A2)</f>"))
+        self.assertIsNone(_FORMULA_TAG_PROBE.search(_HOLIDAYS_SHEET.encode("utf-8")))
+        self.assertIsNone(_FORMULA_TAG_PROBE.search(b"<font/><fill/>"))
+
+    def test_serialized_pack_is_cached_on_disk_by_content_hash(self):
+        workbook = _workbook_bytes()
+        with tempfile.TemporaryDirectory() as tmp:
+            cache_dir = Path(tmp)
+            payload = extract_model_pack_json(workbook, cache_dir=cache_dir)
+            cache_path = cache_dir / f"{sha256(workbook).hexdigest()}.json"
+
+            self.assertEqual(payload, cache_path.read_bytes())
+            self.assertEqual(extract_model_pack(workbook), json.loads(payload))
+
+            cache_path.write_bytes(b'{"cached": true}')
+            self.assertEqual(b'{"cached": true}', extract_model_pack_json(workbook, cache_dir=cache_dir))
+
+    def test_known_digest_skips_rehashing_the_workbook(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            cache_dir = Path(tmp)
+            (cache_dir / "abc123.json").write_bytes(b'{"cached": true}')
+
+            self.assertEqual(
+                b'{"cached": true}',
+                extract_model_pack_json(_workbook_bytes(), cache_dir=cache_dir, digest="abc123"),
+            )
+
+    def test_in_process_cache_is_keyed_by_digest(self):
+        _SERIALIZED_MODEL_PACKS.clear()
+        self.addCleanup(_SERIALIZED_MODEL_PACKS.clear)
+        payload = extract_model_pack_json(_workbook_bytes(), cache_dir=None, digest="abc123")
+
+        # A known digest is served from memory without touching the bytes again.
+        self.assertEqual(payload, extract_model_pack_json(b"not a workbook", cache_dir=None, digest="abc123"))
+        self.assertEqual(["abc123"], list(_SERIALIZED_MODEL_PACKS))
+
+    def test_rejects_non_zip_payload(self):
+        with self.assertRaises(ModelPackError):
+            extract_model_pack(b"not a workbook")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,11 +2,12 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 import json
+from operator import attrgetter
 from pathlib import Path
 from typing import Dict, List
 
 from data_loader import load_model_inputs
-from model import Premissas, build_flow
+from model import PeriodResult, Premissas, build_flow
 
 
 @dataclass(frozen=True)
@@ -17,6 +18,10 @@ class ValidationResult:
     diff: float
 
 
+_VALIDATED_FIELDS = ("pl_fidc", "pl_senior", "pl_mezz", "pl_sub_jr", "pmt_senior", "pmt_mezz", "pmt_sub_jr")
+_VALIDATED_VALUES = attrgetter(*_VALIDATED_FIELDS)
+
+
 def _read_expected_samples(path: str) -> List[Dict[str, float]]:
     data = json.loads(Path(path).read_text(encoding="utf-8"))
     return data.get("expected", {}).get("timeline_samples", [])
@@ -41,34 +46,29 @@ def validate_base(path: str, tolerance: float = 1e-2) -> List[ValidationResult]:
         return []
 
     expected_samples = _read_expected_samples(path)
+    results_by_indice: Dict[int, PeriodResult] = {}
+    for result in results:
+        results_by_indice.setdefault(result.indice, result)
 
     comparisons: List[ValidationResult] = []
     for expected in expected_samples:
         indice = int(expected.get("indice", 0))
-        try:
-            model_index = next(i for i, r in enumerate(results) if r.indice == indice)
-        except StopIteration:
+        result = results_by_indice.get(indice)
+        if result is None:
             continue
-        result = results[model_index]
-        for key, model_value in [
-            ("pl_fidc", result.pl_fidc),
-            ("pl_senior", result.pl_senior),
-            ("pl_mezz", result.pl_mezz),
-            ("pl_sub_jr", result.pl_sub_jr),
-            ("pmt_senior", result.pmt_senior),
-            ("pmt_mezz", result.pmt_mezz),
-            ("pmt_sub_jr", result.pmt_sub_jr),
-        ]:
+        for key, model_value in zip(_VALIDATED_FIELDS, _VALIDATED_VALUES(result)):
             expected_value = expected.get(key)
             if expected_value is None:
                 continue
-            diff = abs(float(expected_value) - float(model_value))
+            excel_value = float(expected_value)
+            model_value = float(model_value)
+            diff = abs(excel_value - model_value)
             if diff > tolerance:
                 comparisons.append(
                     ValidationResult(
                         label=f"Indice {indice} {key}",
-                        excel_value=float(expected_value),
-                        model_value=float(model_value),
+                        excel_value=excel_value,
+                        model_value=model_value,
                         diff=diff,
                     )
                 )